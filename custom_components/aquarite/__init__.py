@@ -5,16 +5,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 import logging
 
-from aioaquarite import AquariteAuth, AquariteClient, AuthenticationError
+from aioaquarite import AuthenticationError
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
+from .account import AquariteAccount, async_acquire_account, async_release_account
+from .const import DOMAIN, STORAGE_VERSION
 from .coordinator import AquariteDataUpdateCoordinator
+from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,53 +38,51 @@ class AquariteRuntimeData:
     """Runtime data for the Aquarite integration."""
 
     coordinator: AquariteDataUpdateCoordinator
-    auth: AquariteAuth
+    account: AquariteAccount
 
 
 AquariteConfigEntry = ConfigEntry[AquariteRuntimeData]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: AquariteConfigEntry) -> bool:
-    """Set up Aquarite from a config entry."""
-    try:
-        user_config = entry.data
-        session = async_get_clientsession(hass)
-        pool_id: str = user_config["pool_id"]
-
-        auth = AquariteAuth(
-            session, user_config[CONF_USERNAME], user_config[CONF_PASSWORD]
-        )
-        await auth.authenticate()
-
-        api = AquariteClient(auth)
-
-        coordinator = AquariteDataUpdateCoordinator(hass, entry, auth, api, pool_id)
-
-        # Initial data fetch and subscription
-        coordinator.data = await api.fetch_pool_data(pool_id)
-        await coordinator.subscribe()
+    """Set up Aquarite from a config entry.
+
+    When a snapshot from a previous run is cached, entities are created from
+    it straight away and the cloud connection is established in the
+    background; otherwise setup waits for the first fetch.  Entries of the
+    same Hayward account share one authenticated session.
+    """
+    user_config = entry.data
+    pool_id: str = user_config["pool_id"]
+    account = async_acquire_account(
+        hass, user_config[CONF_USERNAME], user_config[CONF_PASSWORD]
+    )
+    coordinator = AquariteDataUpdateCoordinator(hass, entry, account, pool_id)
+    account.attach(coordinator)
 
-        # Start background tasks (token refresh and health check)
-        await coordinator.setup_tasks()
+    try:
+        cached = await coordinator.async_load_cache()
+        if cached is None:
+            await coordinator.async_connect()
+        else:
+            coordinator.data = cached
+            entry.async_create_background_task(
+                hass,
+                coordinator.async_connect_in_background(),
+                "Aquarite connect",
+            )
 
         entry.runtime_data = AquariteRuntimeData(
             coordinator=coordinator,
-            auth=auth,
+            account=account,
         )
 
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-        async def handle_sync_time(call: ServiceCall) -> None:
-            """Service call to sync pool time for all loaded entries."""
-            for config_entry in hass.config_entries.async_entries(DOMAIN):
-                if config_entry.state is ConfigEntryState.LOADED:
-                    await config_entry.runtime_data.coordinator.set_pool_time_to_now()
-
-        if not hass.services.has_service(DOMAIN, "sync_pool_time"):
-            hass.services.async_register(DOMAIN, "sync_pool_time", handle_sync_time)
+        async_setup_services(hass)
 
         def _maybe_remove_service() -> None:
-            """Remove service if this is the last loaded entry."""
+            """Remove services if this is the last loaded entry."""
             remaining = [
                 e
                 for e in hass.config_entries.async_entries(DOMAIN)
@@ -90,19 +90,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: AquariteConfigEntry) ->
                 and e.state is ConfigEntryState.LOADED
             ]
             if not remaining:
-                hass.services.async_remove(DOMAIN, "sync_pool_time")
+                async_unload_services(hass)
 
         entry.async_on_unload(_maybe_remove_service)
 
         return True
 
     except AuthenticationError as exc:
+        await _async_release(hass, coordinator)
         raise ConfigEntryAuthFailed from exc
     except Exception as exc:
         _LOGGER.error("Error setting up entry %s: %s", entry.entry_id, exc)
+        await _async_release(hass, coordinator)
         raise ConfigEntryNotReady from exc
 
 
+async def _async_release(
+    hass: HomeAssistant, coordinator: AquariteDataUpdateCoordinator
+) -> None:
+    """Shut a pool down and drop its reference to the shared account."""
+    await coordinator.async_shutdown()
+    coordinator.account.detach(coordinator)
+    await async_release_account(hass, coordinator.account)
+
+
 async def async_unload_entry(
     hass: HomeAssistant, entry: AquariteConfigEntry
 ) -> bool:
@@ -110,6 +121,11 @@ async def async_unload_entry(
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unloaded:
-        await entry.runtime_data.coordinator.async_shutdown()
+        await _async_release(hass, entry.runtime_data.coordinator)
 
     return unloaded
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: AquariteConfigEntry) -> None:
+    """Delete the cached snapshot when an entry is removed."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
@@ -0,0 +1,342 @@
+"""Shared Hayward account connection for the Aquarite integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+import itertools
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from aioaquarite import AquariteAuth, AquariteClient, AuthenticationError
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .breaker import AquariteCircuitBreaker
+from .const import (
+    CONNECTION_AUTH_FAILED,
+    CONNECTION_BACKOFF,
+    CONNECTION_LIVE,
+    CONNECTION_RESUBSCRIBING,
+    CONNECTION_STALE,
+    DOMAIN,
+    TOKEN_RETRY_DELAY,
+    WATCHDOG_INTERVAL,
+)
+from .scheduler import async_get_scheduler
+
+if TYPE_CHECKING:
+    from .coordinator import AquariteDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ACCOUNTS = f"{DOMAIN}_accounts"
+
+
+class AquariteWatchRegistry:
+    """Per-account registry of pool watches, one watch per pool.
+
+    Each attached pool is watched through the library's ``subscribe_pool``
+    and its snapshots are handed to the pool's callback.  Watches of any
+    set of pools can be rebuilt without touching the others.  Sharing one
+    watch between the pools of an account needs a multi-document
+    subscription in aioaquarite, which it does not offer yet.
+
+    Rebuilds are make-before-break: a pool's new watch is live before the
+    old one closes, so no change falls into a gap.  Every watch carries a
+    generation; once a newer watch of a pool has delivered, anything the
+    older one still delivers is stale and dropped.  Documents delivered
+    by both are dropped by the coordinators' fingerprint check.
+    """
+
+    def __init__(self, api: AquariteClient) -> None:
+        """Initialize the registry."""
+        self._api = api
+        self._callbacks: dict[str, Callable[[dict[str, Any]], None]] = {}
+        # pool id -> (generation, watch) of the installed watch
+        self._watches: dict[str, tuple[int, Any]] = {}
+        # When each pool's current watch started (time.monotonic())
+        self.started_at: dict[str, float] = {}
+        self._lock = asyncio.Lock()
+        self._generations = itertools.count(1)
+        # Newest generation that delivered per pool, across watch threads
+        self._routed: dict[str, int] = {}
+        self._routed_lock = threading.Lock()
+
+    @property
+    def pool_ids(self) -> frozenset[str]:
+        """Return the ids of the attached pools."""
+        return frozenset(self._callbacks)
+
+    async def async_attach(
+        self, pool_id: str, on_data: Callable[[dict[str, Any]], None]
+    ) -> None:
+        """Route snapshots of a pool to a callback and start watching it."""
+        # Replace rather than mutate: the Firestore threads read this dict.
+        self._callbacks = {**self._callbacks, pool_id: on_data}
+        async with self._lock:
+            if pool_id not in self._watches:
+                await self._async_rebuild((pool_id,))
+
+    async def async_detach(self, pool_id: str) -> None:
+        """Stop routing and watching a pool."""
+        self._callbacks = {
+            key: value for key, value in self._callbacks.items() if key != pool_id
+        }
+        async with self._lock:
+            await self._async_stop(pool_id)
+
+    async def async_resubscribe(self, pool_ids: Iterable[str] | None = None) -> None:
+        """Rebuild the watches of some or all attached pools.
+
+        Used after a token refresh (all pools) or for a stalled stream.
+        """
+        async with self._lock:
+            attached = self.pool_ids
+            await self._async_rebuild(
+                sorted(attached if pool_ids is None else attached & set(pool_ids))
+            )
+
+    async def _async_rebuild(self, pool_ids: Iterable[str]) -> None:
+        """Replace the watches of pools with new ones.
+
+        The old watches are only stopped once all new ones are running; if
+        starting them fails, the old watches are kept and the error raised.
+        """
+        started: dict[str, tuple[int, Any]] = {}
+        try:
+            for pool_id in pool_ids:
+                generation = next(self._generations)
+                started[pool_id] = (
+                    generation,
+                    await self._api.subscribe_pool(
+                        pool_id, self._router(pool_id, generation)
+                    ),
+                )
+        except BaseException:
+            with self._routed_lock:
+                for pool_id in started:
+                    # The abandoned watch may have delivered already.
+                    installed = self._watches.get(pool_id)
+                    self._routed[pool_id] = installed[0] if installed else 0
+            for _, watch in started.values():
+                await asyncio.to_thread(watch.unsubscribe)
+            raise
+
+        now = time.monotonic()
+        old_watches = []
+        for pool_id, entry in started.items():
+            if (previous := self._watches.get(pool_id)) is not None:
+                old_watches.append(previous[1])
+            self._watches[pool_id] = entry
+            self.started_at[pool_id] = now
+        for watch in old_watches:
+            await asyncio.to_thread(watch.unsubscribe)
+
+    async def _async_stop(self, pool_id: str) -> None:
+        """Stop the watch of a pool."""
+        entry = self._watches.pop(pool_id, None)
+        self.started_at.pop(pool_id, None)
+        with self._routed_lock:
+            self._routed.pop(pool_id, None)
+        if entry is not None:
+            await asyncio.to_thread(entry[1].unsubscribe)
+
+    def _router(
+        self, pool_id: str, generation: int
+    ) -> Callable[[dict[str, Any]], None]:
+        """Return the Firestore-thread callback of one watch of a pool."""
+
+        def _on_data(data: dict[str, Any]) -> None:
+            on_data = self._callbacks.get(pool_id)
+            if on_data is None:
+                return
+            with self._routed_lock:
+                if generation < self._routed.get(pool_id, 0):
+                    return
+                self._routed[pool_id] = generation
+            on_data(data)
+
+        return _on_data
+
+    async def async_shutdown(self) -> None:
+        """Stop every watch."""
+        self._callbacks = {}
+        async with self._lock:
+            for pool_id in list(self._watches):
+                await self._async_stop(pool_id)
+
+
+class AquariteAccount:
+    """Authenticated session shared by all config entries of one account.
+
+    Holds a single AquariteAuth/AquariteClient pair, one watch registry,
+    one token refresh job and one staleness watchdog for every pool of
+    the account, both run by the integration-wide scheduler, and one
+    circuit breaker that all of their cloud calls go through.  Entries
+    acquire the account on setup and release it on unload; the jobs stop
+    when the last entry is released.
+    """
+
+    def __init__(self, hass: HomeAssistant, username: str, password: str) -> None:
+        """Initialize the account."""
+        self.hass = hass
+        self.username = username
+        self.password = password
+        self.auth = AquariteAuth(async_get_clientsession(hass), username, password)
+        self.api = AquariteClient(self.auth)
+        self.watches = AquariteWatchRegistry(self.api)
+        self.breaker = AquariteCircuitBreaker(hass, username)
+        self.coordinators: dict[str, AquariteDataUpdateCoordinator] = {}
+        self._users = 0
+        self._authenticated = False
+        self._auth_lock = asyncio.Lock()
+        self._unschedule: list[CALLBACK_TYPE] = []
+
+    @callback
+    def attach(self, coordinator: AquariteDataUpdateCoordinator) -> None:
+        """Register a pool coordinator for subscription refreshes."""
+        self.coordinators[coordinator.pool_id] = coordinator
+
+    @callback
+    def detach(self, coordinator: AquariteDataUpdateCoordinator) -> None:
+        """Unregister a pool coordinator."""
+        if self.coordinators.get(coordinator.pool_id) is coordinator:
+            del self.coordinators[coordinator.pool_id]
+
+    async def async_authenticate(self) -> None:
+        """Log in once for all entries and schedule the shared background jobs."""
+        async with self._auth_lock:
+            if self._authenticated:
+                return
+            await self.auth.authenticate()
+            self._authenticated = True
+            scheduler = async_get_scheduler(self.hass)
+            self._unschedule = [
+                scheduler.async_schedule(
+                    f"Aquarite watchdog {self.username}",
+                    self._async_check_staleness,
+                    WATCHDOG_INTERVAL,
+                ),
+                scheduler.async_schedule(
+                    f"Aquarite token refresh {self.username}",
+                    self._async_refresh_token,
+                    self.auth.calculate_sleep_duration(),
+                ),
+            ]
+
+    @callback
+    def _async_set_connection_state(
+        self, state: str, pool_ids: Iterable[str] | None = None
+    ) -> None:
+        """Move the connection state of attached pools, or of ``pool_ids``."""
+        pool_ids = self.watches.pool_ids if pool_ids is None else pool_ids
+        for pool_id in pool_ids:
+            if coordinator := self.coordinators.get(pool_id):
+                coordinator.async_set_connection_state(state)
+
+    async def _refresh_subscriptions(self) -> None:
+        """Resubscribe every attached pool.
+
+        Pools count as live again once their new watch delivers a snapshot.
+        """
+        self._async_set_connection_state(CONNECTION_RESUBSCRIBING)
+        try:
+            await self.watches.async_resubscribe()
+        except AuthenticationError:
+            self._async_set_connection_state(CONNECTION_AUTH_FAILED)
+            raise
+        except Exception:
+            self._async_set_connection_state(CONNECTION_BACKOFF)
+            raise
+
+    async def _async_refresh_token(self) -> float:
+        """Refresh the token if it is expiring and return the next check delay.
+
+        After a failure the token is checked again soon; that retry waits
+        on the circuit breaker, which spaces attempts out.
+        """
+        try:
+            if self.auth.is_token_expiring():
+                _LOGGER.debug("Token expiring soon, refreshing...")
+                async with self.breaker.async_attempt():
+                    _, refreshed = await self.auth.get_client()
+                    if refreshed:
+                        await self._refresh_subscriptions()
+        except AuthenticationError as err:
+            _LOGGER.error("Authentication failed while refreshing token: %s", err)
+            self._async_set_connection_state(CONNECTION_AUTH_FAILED)
+            return TOKEN_RETRY_DELAY
+        except Exception as err:
+            _LOGGER.error("Error maintaining token: %s", err)
+            return TOKEN_RETRY_DELAY
+        return self.auth.calculate_sleep_duration()
+
+    def stale_pools(self, now: float) -> list[str]:
+        """Return the attached pools whose stream has gone quiet."""
+        started_at = self.watches.started_at
+        return [
+            pool_id
+            for pool_id, coordinator in self.coordinators.items()
+            if pool_id in self.watches.pool_ids
+            and coordinator.is_stale(now, started_at.get(pool_id))
+        ]
+
+    async def _async_check_staleness(self) -> float:
+        """Resubscribe when a pool's stream stops delivering snapshots.
+
+        Firestore keeps an idle stream open with its own keepalives, so a
+        watch that stopped delivering is only visible from the data side:
+        no snapshot for several times the pool's usual cadence.  Checking
+        that is local, so it runs often without any cloud round trip.  Only
+        the watches of the quiet pools are rebuilt.
+        """
+        for pool_id in self.stale_pools(time.monotonic()):
+            coordinator = self.coordinators[pool_id]
+            _LOGGER.warning("No snapshot received for %s, resubscribing", pool_id)
+            if coordinator.connection_state == CONNECTION_LIVE:
+                coordinator.async_set_connection_state(CONNECTION_STALE)
+            try:
+                await coordinator.refresh_subscription()
+            except Exception as err:
+                _LOGGER.error("Resubscribe of %s failed: %s", pool_id, err)
+        return WATCHDOG_INTERVAL
+
+    async def async_shutdown(self) -> None:
+        """Cancel the shared background jobs."""
+        for unschedule in self._unschedule:
+            unschedule()
+        self._unschedule = []
+        self._authenticated = False
+        await self.watches.async_shutdown()
+
+
+@callback
+def async_acquire_account(
+    hass: HomeAssistant, username: str, password: str
+) -> AquariteAccount:
+    """Return the shared account for a username, creating it if needed.
+
+    Entries only share an account when their credentials match; new
+    credentials (after a reconfigure) get a fresh account while entries
+    still using the old one keep it until they unload.
+    """
+    accounts: dict[str, AquariteAccount] = hass.data.setdefault(DATA_ACCOUNTS, {})
+    account = accounts.get(username)
+    if account is None or account.password != password:
+        account = accounts[username] = AquariteAccount(hass, username, password)
+    account._users += 1
+    return account
+
+
+async def async_release_account(hass: HomeAssistant, account: AquariteAccount) -> None:
+    """Drop a reference to an account, shutting it down when unused."""
+    account._users -= 1
+    if account._users > 0:
+        return
+    accounts: dict[str, AquariteAccount] = hass.data.get(DATA_ACCOUNTS, {})
+    if accounts.get(account.username) is account:
+        del accounts[account.username]
+    await account.async_shutdown()
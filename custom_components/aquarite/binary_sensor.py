@@ -240,6 +240,11 @@ class AquariteBinarySensorTankEntity(AquariteEntity, BinarySensorEntity):
         self._attr_translation_key = translation_key
         self._attr_unique_id = self.build_unique_id(name)
 
+    @property
+    def value_paths(self) -> frozenset[str]:
+        """Return the tank paths of all modules."""
+        return frozenset(TANK_MODULE_PATHS)
+
     @property
     def is_on(self) -> bool:
         """Return true if any tank is low."""
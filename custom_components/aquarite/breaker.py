@@ -0,0 +1,143 @@
+"""Circuit breaker shared by the cloud calls of one Hayward account."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+import contextlib
+from datetime import datetime
+import logging
+import random
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    BREAKER_BASE_DELAY,
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_MAX_DELAY,
+    BREAKER_OPEN,
+    BREAKER_RECOVERY_STAGGER,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AquariteCircuitBreaker:
+    """Gate every reconnect, resubscribe and token refresh of an account.
+
+    While closed, calls go straight through.  A failure opens the breaker
+    for a jittered, exponentially growing delay during which every caller
+    waits instead of retrying on its own.  Once the delay has passed, the
+    first caller becomes the half-open probe; the others keep waiting for
+    its outcome.  If the probe succeeds the breaker closes and the
+    waiting callers are let through one by one, BREAKER_RECOVERY_STAGGER
+    seconds apart, rather than all at once; if it fails the breaker opens
+    again for longer.
+    """
+
+    def __init__(self, hass: HomeAssistant, name: str) -> None:
+        """Initialize the breaker."""
+        self._hass = hass
+        self._name = name
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.last_error: str | None = None
+        self.opened_at: datetime | None = None
+        self._retry_at = 0.0  # loop time
+        self._next_slot = 0.0  # loop time of the next staggered release
+        self._changed = asyncio.Event()
+
+    @contextlib.asynccontextmanager
+    async def async_attempt(self) -> AsyncIterator[None]:
+        """Wait for a turn, then record the outcome of the guarded call."""
+        probe = await self._async_wait_turn()
+        try:
+            yield
+        except Exception as err:
+            self._async_record_failure(err)
+            raise
+        except BaseException:
+            if probe:
+                # Cancelled probe: let another caller probe right away.
+                self.state = BREAKER_OPEN
+                self._retry_at = self._hass.loop.time()
+                self._async_notify()
+            raise
+        else:
+            self._async_record_success()
+
+    async def _async_wait_turn(self) -> bool:
+        """Wait until a call may go out; return true for the half-open probe."""
+        loop = self._hass.loop
+        waited = False
+        while self.state != BREAKER_CLOSED:
+            waited = True
+            timeout = None
+            if self.state == BREAKER_OPEN:
+                if (timeout := self._retry_at - loop.time()) <= 0:
+                    self.state = BREAKER_HALF_OPEN
+                    _LOGGER.debug("Probing the connection of %s", self._name)
+                    return True
+            event = self._changed
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(timeout):
+                    await event.wait()
+        if waited:
+            slot = max(loop.time(), self._next_slot)
+            self._next_slot = slot + BREAKER_RECOVERY_STAGGER
+            await asyncio.sleep(slot - loop.time())
+        return False
+
+    @callback
+    def _async_record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        if self.state == BREAKER_CLOSED and not self.failures:
+            return
+        if self.state != BREAKER_CLOSED:
+            _LOGGER.info("Connection of %s restored", self._name)
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._next_slot = self._hass.loop.time()
+        self._async_notify()
+
+    @callback
+    def _async_record_failure(self, err: Exception) -> None:
+        """Open the breaker for a jittered, growing delay."""
+        self.last_error = str(err) or type(err).__name__
+        if self.state == BREAKER_OPEN:
+            # A call started before the breaker opened; already accounted for.
+            return
+        self.failures += 1
+        delay = min(BREAKER_BASE_DELAY * 2 ** (self.failures - 1), BREAKER_MAX_DELAY)
+        delay *= 0.5 + random.random() / 2
+        _LOGGER.warning(
+            "Cloud call for %s failed (%s), holding retries for %.0fs",
+            self._name, self.last_error, delay,
+        )
+        if self.state == BREAKER_CLOSED:
+            self.opened_at = dt_util.utcnow()
+        self.state = BREAKER_OPEN
+        self._retry_at = self._hass.loop.time() + delay
+        self._async_notify()
+
+    @callback
+    def _async_notify(self) -> None:
+        """Wake every waiting caller to re-check the state."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        retry_in = None
+        if self.state == BREAKER_OPEN:
+            retry_in = max(self._retry_at - self._hass.loop.time(), 0)
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
+            "retry_in": retry_in,
+        }
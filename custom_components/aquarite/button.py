@@ -3,17 +3,21 @@ from __future__ import annotations
 
 import asyncio
 
+import voluptuous as vol
+
 from homeassistant.components.button import ButtonEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AquariteConfigEntry
-from .const import LED_PULSE_DELAY, PATH_HASLED
+from .const import ATTR_STEPS, MAX_LED_STEPS, PATH_HASLED, SERVICE_ADVANCE_LED_COLOR
 from .coordinator import AquariteDataUpdateCoordinator
 from .entity import AquariteEntity
 
-PARALLEL_UPDATES = 1
+# Presses must reach the entity concurrently so they can be coalesced.
+PARALLEL_UPDATES = 0
 
 
 async def async_setup_entry(
@@ -32,6 +36,17 @@ async def async_setup_entry(
         AquariteLEDPulseButtonEntity(dataservice, pool_id, pool_name)
     ])
 
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_ADVANCE_LED_COLOR,
+        {
+            vol.Optional(ATTR_STEPS, default=1): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=MAX_LED_STEPS)
+            ),
+        },
+        "async_advance",
+    )
+
 
 class AquariteLEDPulseButtonEntity(AquariteEntity, ButtonEntity):
     """Button that power-cycles the pool light to advance the LED color.
@@ -53,19 +68,79 @@ class AquariteLEDPulseButtonEntity(AquariteEntity, ButtonEntity):
         super().__init__(coordinator, pool_id, pool_name)
         self._attr_translation_key = "led_pulse"
         self._attr_unique_id = self.build_unique_id("LEDPulse")
+        self._steps_pending = 0
+        self._sequence: asyncio.Task[None] | None = None
+        # One future per caller waiting on the running sequence
+        self._waiters: list[asyncio.Future[None]] = []
+
+    @property
+    def value_paths(self) -> frozenset[str]:
+        """Return no paths; the button has no state derived from data."""
+        return frozenset()
 
     async def async_press(self) -> None:
-        """Send a pulse to the pool LED.
+        """Advance the pool LED by one colour."""
+        await self.async_advance()
 
-        If the light is already on, turn it off, wait LED_PULSE_DELAY
-        seconds, then turn it back on — the physical LED fixture
-        advances to the next colour on power-on.  If the light is off,
-        simply turn it on.
+    async def async_advance(self, steps: int = 1) -> None:
+        """Advance the pool LED by a number of colours.
+
+        Steps requested while a sequence is running are added to it, so
+        repeated presses and service calls become one pending sequence;
+        every caller returns when that sequence has finished, or raises
+        if it failed.
         """
+        self._steps_pending += steps
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self._waiters.append(future)
+        if self._sequence is None or self._sequence.done():
+            self._sequence = self.hass.async_create_task(
+                self._async_run_sequence(), f"Aquarite LED sequence {self._pool_id}"
+            )
         try:
-            if self.coordinator.get_value("light.status"):
-                await self.coordinator.api.set_value(self._pool_id, "light.status", 0)
-                await asyncio.sleep(LED_PULSE_DELAY)
-            await self.coordinator.api.set_value(self._pool_id, "light.status", 1)
+            await future
+        except HomeAssistantError:
+            raise
         except Exception as err:
             raise HomeAssistantError(f"Failed to pulse LED: {err}") from err
+
+    async def _async_run_sequence(self) -> None:
+        """Pulse the LED until no steps are pending, then answer every caller.
+
+        A failed pulse drops the remaining steps and fails every caller
+        waiting on the sequence, including those whose steps were queued
+        behind the failing one.
+        """
+        error: Exception | None = None
+        try:
+            while self._steps_pending:
+                self._steps_pending -= 1
+                await self._async_pulse()
+        except asyncio.CancelledError:
+            error = HomeAssistantError("LED sequence was cancelled")
+            raise
+        except Exception as err:
+            error = err
+        finally:
+            self._steps_pending = 0
+            waiters, self._waiters = self._waiters, []
+            for future in waiters:
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+    async def _async_pulse(self) -> None:
+        """Send one pulse to the pool LED.
+
+        If the light is already on, turn it off, wait until the controller
+        reports it off, then turn it back on — the physical LED fixture
+        advances to the next colour on power-on.  If the light is off,
+        simply turn it on.  Each transition waits for its snapshot so the
+        next pulse starts as soon as the fixture has accepted this one.
+        """
+        if self.coordinator.get_value("light.status"):
+            await self.coordinator.set_and_confirm("light.status", 0)
+        await self.coordinator.set_and_confirm("light.status", 1)
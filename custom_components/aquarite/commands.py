@@ -0,0 +1,268 @@
+"""Outgoing command handling for the Aquarite integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+import logging
+import time
+from typing import Any
+
+from aioaquarite import AquariteClient
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import WRITE_BATCH_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# (value to write, callers waiting for the outcome)
+_PendingWrite = tuple[Any, list[asyncio.Future[None]]]
+
+
+class AquaritePendingTargets:
+    """Values written to the pool that no snapshot has confirmed yet.
+
+    While a target is pending, the entity that wrote it shows it instead
+    of the reported value so the UI reflects a command immediately.  A target is dropped
+    once a snapshot reports it, when its write fails, or ``timeout``
+    seconds after it was set.  Expiry runs on one loop timer armed for
+    the earliest deadline, so reads never consult the clock; expired
+    paths are passed to ``on_expire`` once.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        timeout: float,
+        on_expire: Callable[[frozenset[str]], None],
+    ) -> None:
+        """Initialize the pending targets."""
+        self._hass = hass
+        self._timeout = timeout
+        self._on_expire = on_expire
+        # path -> (target value, loop time when it expires)
+        self._targets: dict[str, tuple[Any, float]] = {}
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._timer_deadline: float | None = None
+
+    def __bool__(self) -> bool:
+        """Return true if any target is pending."""
+        return bool(self._targets)
+
+    def get(self, path: str, default: Any = _MISSING) -> Any:
+        """Return the pending target of a path."""
+        entry = self._targets.get(path)
+        return default if entry is None else entry[0]
+
+    @callback
+    def set(self, path: str, value: Any) -> tuple[Any, float]:
+        """Record a target for a path and return its token."""
+        entry = self._targets[path] = (
+            value,
+            self._hass.loop.time() + self._timeout,
+        )
+        self._async_arm()
+        return entry
+
+    @callback
+    def discard(self, path: str, token: tuple[Any, float]) -> bool:
+        """Drop a target unless it was replaced by a newer one."""
+        if self._targets.get(path) is not token:
+            return False
+        del self._targets[path]
+        self._async_arm()
+        return True
+
+    @callback
+    def confirm(self, reported: Callable[[str], Any]) -> None:
+        """Drop every target whose value a snapshot now reports."""
+        for path, (value, _) in list(self._targets.items()):
+            if reported(path) == value:
+                del self._targets[path]
+        self._async_arm()
+
+    @callback
+    def _async_arm(self) -> None:
+        """Point the timer at the earliest deadline, or stop it."""
+        deadline = min((entry[1] for entry in self._targets.values()), default=None)
+        if deadline == self._timer_deadline:
+            return
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        self._timer_deadline = deadline
+        if deadline is not None:
+            self._cancel_timer = async_call_later(
+                self._hass,
+                max(deadline - self._hass.loop.time(), 0),
+                self._async_expire,
+            )
+
+    @callback
+    def _async_expire(self, *_: Any) -> None:
+        """Drop the targets whose deadline passed and report their paths."""
+        self._cancel_timer = None
+        self._timer_deadline = None
+        now = self._hass.loop.time()
+        expired = frozenset(
+            path for path, (_, deadline) in self._targets.items() if deadline <= now
+        )
+        for path in expired:
+            del self._targets[path]
+        self._async_arm()
+        if expired:
+            self._on_expire(expired)
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop every target and stop the timer."""
+        self._targets.clear()
+        self._async_arm()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the pending targets for diagnostics."""
+        return {path: value for path, (value, _) in self._targets.items()}
+
+
+class AquariteCommandQueue:
+    """Per-path, last-writer-wins queue of value writes for one pool.
+
+    Writes are buffered for WRITE_BATCH_WINDOW seconds and flushed as one
+    batch.  Each path has at most one write in flight: anything queued
+    for it meanwhile collapses to the newest value, which is sent as soon
+    as the in-flight write returns, so an older value can never land after
+    a newer one.  Callers whose value was superseded share the outcome of
+    the write that replaced it.  A write of the value the snapshot already
+    holds is skipped, but only when nothing is queued or in flight for the
+    path and the snapshot reports the last value sent for it; otherwise
+    an unconfirmed earlier write could still land after the skip.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: AquariteClient,
+        pool_id: str,
+        current_value: Callable[[str], Any],
+    ) -> None:
+        """Initialize the queue."""
+        self._hass = hass
+        self._api = api
+        self._pool_id = pool_id
+        self._current_value = current_value
+        self._pending: dict[str, _PendingWrite] = {}
+        self._in_flight: set[str] = set()
+        # Last value sent per path, until a snapshot reports it
+        self._sent: dict[str, Any] = {}
+        # Accepted writes awaiting their echo: path -> (value, monotonic time)
+        self._echoes: dict[str, tuple[Any, float]] = {}
+        self._cancel_flush: CALLBACK_TYPE | None = None
+
+    def _is_settled(self, path: str, value: Any) -> bool:
+        """Return true if the pool reports value and no write can change it."""
+        if path in self._pending or path in self._in_flight:
+            return False
+        current = self._current_value(path)
+        sent = self._sent.get(path, _MISSING)
+        if sent is not _MISSING:
+            if current != sent:
+                return False
+            del self._sent[path]
+        return current == value
+
+    async def async_write(self, path: str, value: Any) -> bool:
+        """Queue a write and wait until it, or a newer one, has been sent.
+
+        Returns false if the write was skipped because it changes nothing.
+        """
+        if self._is_settled(path, value):
+            return False
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        _, waiters = self._pending.get(path, (None, []))
+        self._pending[path] = (value, [*waiters, future])
+        if self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self._hass, WRITE_BATCH_WINDOW, self._async_flush
+            )
+        await future
+        return True
+
+    @callback
+    def _async_flush(self, *_: Any) -> None:
+        """Send everything queued during the window."""
+        self._cancel_flush = None
+        self._async_send_paths(list(self._pending))
+
+    @callback
+    def _async_send_paths(self, paths: Iterable[str]) -> None:
+        """Start writing the queued values of paths with nothing in flight."""
+        batch = {
+            path: self._pending.pop(path)
+            for path in paths
+            if path in self._pending and path not in self._in_flight
+        }
+        if batch:
+            self._in_flight.update(batch)
+            self._hass.async_create_task(self._async_send(batch))
+
+    async def _async_send(self, batch: dict[str, _PendingWrite]) -> None:
+        """Write a batch and resolve each caller with its own result."""
+        _LOGGER.debug("Writing %s to pool %s", list(batch), self._pool_id)
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._api.set_value(self._pool_id, path, value)
+                    for path, (value, _) in batch.items()
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            self._in_flight.difference_update(batch)
+        accepted = time.monotonic()
+        # Even a failed write may have landed; never assume it did not.
+        for (path, (value, _)), result in zip(batch.items(), results):
+            self._sent[path] = value
+            if isinstance(result, BaseException):
+                self._echoes.pop(path, None)
+            else:
+                self._echoes[path] = (value, accepted)
+        for (_, waiters), result in zip(batch.values(), results):
+            for future in waiters:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(None)
+        # Values queued behind these writes go out right away.
+        self._async_send_paths(batch)
+
+    @callback
+    def async_take_echoes(self, reported: Callable[[str], Any]) -> list[float]:
+        """Return when each accepted write a snapshot now reports was sent.
+
+        Every write is returned at most once.
+        """
+        echoed = [
+            path
+            for path, (value, _) in self._echoes.items()
+            if reported(path) == value
+        ]
+        return [self._echoes.pop(path)[1] for path in echoed]
+
+    async def async_shutdown(self) -> None:
+        """Send any writes still waiting for their window."""
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        batch = {
+            path: self._pending.pop(path)
+            for path in list(self._pending)
+            if path not in self._in_flight
+        }
+        if batch:
+            self._in_flight.update(batch)
+            await self._async_send(batch)
@@ -18,7 +18,15 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 
-from .const import CONF_HEALTH_CHECK_INTERVAL, DEFAULT_HEALTH_CHECK_INTERVAL, DOMAIN
+from .const import (
+    CONF_CLOCK_DRIFT_THRESHOLD,
+    CONF_COALESCE_WINDOW,
+    CONF_HEALTH_CHECK_INTERVAL,
+    DEFAULT_CLOCK_DRIFT_THRESHOLD,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_HEALTH_CHECK_INTERVAL,
+    DOMAIN,
+)
 
 AUTH_SCHEMA = vol.Schema(
     {
@@ -38,14 +46,25 @@ class AquariteOptionsFlow(OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(data=user_input)
 
-        current = self.config_entry.options.get(
-            CONF_HEALTH_CHECK_INTERVAL, DEFAULT_HEALTH_CHECK_INTERVAL
-        )
+        options = self.config_entry.options
         schema = vol.Schema(
             {
                 vol.Required(
-                    CONF_HEALTH_CHECK_INTERVAL, default=current
+                    CONF_HEALTH_CHECK_INTERVAL,
+                    default=options.get(
+                        CONF_HEALTH_CHECK_INTERVAL, DEFAULT_HEALTH_CHECK_INTERVAL
+                    ),
                 ): vol.All(int, vol.Range(min=60, max=3600)),
+                vol.Required(
+                    CONF_COALESCE_WINDOW,
+                    default=options.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW),
+                ): vol.All(int, vol.Range(min=0, max=5000)),
+                vol.Required(
+                    CONF_CLOCK_DRIFT_THRESHOLD,
+                    default=options.get(
+                        CONF_CLOCK_DRIFT_THRESHOLD, DEFAULT_CLOCK_DRIFT_THRESHOLD
+                    ),
+                ): vol.All(int, vol.Range(min=0, max=3600)),
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
@@ -15,7 +15,176 @@ PATH_HASLED = f"{PATH_PREFIX}hasLED"
 
 # Time intervals (seconds)
 DEFAULT_HEALTH_CHECK_INTERVAL = 300  # 5 minutes
-LED_PULSE_DELAY = 1.5  # Delay between off and on when cycling LED color
+SCHEDULER_JITTER = 0.1  # Background job delays are shortened by up to 10%
+SCHEDULER_RETRY_DELAY = 60  # Longest wait before rerunning a job that raised
+TOKEN_RETRY_DELAY = 10  # Next token check after a failed refresh
+WATCHDOG_INTERVAL = 5  # How often stream staleness is checked (no cloud call)
+STALENESS_FACTOR = 3  # Silence tolerated, in multiples of a pool's cadence
+STALENESS_MIN = 30  # Shortest silence ever treated as a stalled stream
+LATENCY_UPDATE_INTERVAL = 300  # Refresh of the latency sensors
+CONFIRM_TIMEOUT = 15  # Seconds to wait for a snapshot to confirm a write
+DEFAULT_CLOCK_DRIFT_THRESHOLD = 120  # Seconds of drift before an automatic sync
+CLOCK_SYNC_MIN_INTERVAL = 6 * 3600  # Minimum seconds between automatic syncs
+CLOCK_DRIFT_SAMPLES = 5  # Snapshots the drift estimate is the median of
+CLOCK_DRIFT_MIN_SAMPLES = 3  # Samples needed before syncing automatically
+RECONCILIATION_TIMEOUT = 20  # Seconds to show a written value before reverting
+DEFAULT_COALESCE_WINDOW = 250  # Milliseconds to merge bursts of snapshots
+WRITE_BATCH_WINDOW = 0.1  # Seconds to collect value writes into one batch
+
+# Per-pool connection states
+CONNECTION_CONNECTING = "connecting"
+CONNECTION_LIVE = "live"
+CONNECTION_STALE = "stale"
+CONNECTION_RESUBSCRIBING = "resubscribing"
+CONNECTION_BACKOFF = "backoff"
+CONNECTION_AUTH_FAILED = "auth_failed"
+CONNECTION_STATES: tuple[str, ...] = (
+    CONNECTION_CONNECTING,
+    CONNECTION_LIVE,
+    CONNECTION_STALE,
+    CONNECTION_RESUBSCRIBING,
+    CONNECTION_BACKOFF,
+    CONNECTION_AUTH_FAILED,
+)
+
+# Snapshot latency stages: a write accepted by the cloud to the snapshot
+# reporting it, watch thread to event loop, and applying a snapshot to
+# every affected entity
+LATENCY_CLOUD = "cloud"
+LATENCY_HANDOFF = "handoff"
+LATENCY_FANOUT = "fanout"
+LATENCY_STAGES: tuple[str, ...] = (LATENCY_CLOUD, LATENCY_HANDOFF, LATENCY_FANOUT)
+# Histogram bucket upper bounds (seconds); one more bucket holds the rest
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1, 2.5, 5, 10, 30, 60,
+)
+
+# Account circuit breaker (delays in seconds)
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+BREAKER_BASE_DELAY = 10  # First hold after a failed cloud call
+BREAKER_MAX_DELAY = 600
+BREAKER_RECOVERY_STAGGER = 2  # Spacing of callers released after recovery
+
+# Numeric fields of the pool document; the controller may send them as
+# strings, which are coerced to numbers.  Every other field is left as is.
+NUMERIC_PATHS: frozenset[str] = frozenset({
+    "main.temperature",
+    "main.RSSI",
+    "main.localTime",
+    "main.hasCD",
+    "main.hasCL",
+    "main.hasHidro",
+    "main.hasIO",
+    "main.hasLED",
+    "main.hasPH",
+    "main.hasRX",
+    "main.hasUV",
+    "modules.ph.current",
+    "modules.ph.status.low_value",
+    "modules.ph.status.high_value",
+    "modules.ph.al3",
+    "modules.ph.tank",
+    "modules.ph.pump_high_on",
+    "modules.ph.pump_low_on",
+    "modules.rx.current",
+    "modules.rx.status.value",
+    "modules.rx.tank",
+    "modules.rx.pump_status",
+    "modules.cl.current",
+    "modules.cl.tank",
+    "modules.cl.pump_status",
+    "modules.cd.current",
+    "modules.cd.tank",
+    "modules.uv.current",
+    "hidro.current",
+    "hidro.level",
+    "hidro.maxAllowedValue",
+    "hidro.fl1",
+    "hidro.fl2",
+    "hidro.low",
+    "hidro.cover",
+    "hidro.cover_enabled",
+    "hidro.cloration_enabled",
+    "filtration.status",
+    "filtration.mode",
+    "filtration.manVel",
+    "filtration.hasHeat",
+    "filtration.hasSmart",
+    "filtration.interval1.from",
+    "filtration.interval1.to",
+    "filtration.interval2.from",
+    "filtration.interval2.to",
+    "filtration.interval3.from",
+    "filtration.interval3.to",
+    "filtration.timerVel1",
+    "filtration.timerVel2",
+    "filtration.timerVel3",
+    "filtration.intel.time",
+    "filtration.intel.temp",
+    "filtration.heating.temp",
+    "filtration.heating.tempHi",
+    "filtration.heating.clima",
+    "filtration.smart.tempMin",
+    "filtration.smart.tempHigh",
+    "filtration.smart.freeze",
+    "light.status",
+    "relays.relay1.info.onoff",
+    "relays.relay2.info.onoff",
+    "relays.relay3.info.onoff",
+    "relays.relay4.info.onoff",
+    "relays.filtration.heating.status",
+    "backwash.status",
+})
+
+# Alarm paths whose changes bypass snapshot coalescing
+URGENT_PATHS: tuple[str, ...] = (
+    "present",
+    "hidro.fl1",
+    "hidro.fl2",
+    "hidro.low",
+    "modules.ph.al3",
+    "modules.ph.tank",
+    "modules.rx.tank",
+    "modules.cl.tank",
+    "modules.cd.tank",
+)
+
+# Persisted last-known snapshot
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30  # Seconds to batch snapshot writes to disk
+# Personal fields of the pool document: never stored, redacted in diagnostics
+POOL_PRIVATE_KEYS = frozenset({"city", "street", "zipcode", "lat", "lng", "email"})
+
+# Controller integer scale of number values (raw = value * scale)
+NUMBER_SCALE_MAP: dict[str, int] = {
+    "modules.ph.status.low_value": 100,
+    "modules.ph.status.high_value": 100,
+    "hidro.level": 10,
+}
+
+# Select options, indexed by the raw controller value
+PUMP_MODE_OPTIONS: tuple[str, ...] = ("manual", "auto", "heat", "smart", "intel")
+PUMP_SPEED_OPTIONS: tuple[str, ...] = ("slow", "medium", "high")
+TIMER_SPEED_OPTIONS: tuple[str, ...] = ("slow", "medium", "high")
+
+# Filtration schedule
+FILTRATION_INTERVALS = (1, 2, 3)
+
+# Services
+SERVICE_SYNC_POOL_TIME = "sync_pool_time"
+SERVICE_ADVANCE_LED_COLOR = "advance_led_color"
+SERVICE_SET_FILTRATION_SCHEDULE = "set_filtration_schedule"
+SERVICE_APPLY_SETTINGS = "apply_settings"
+ATTR_SETTINGS = "settings"
+ATTR_STEPS = "steps"
+MAX_LED_STEPS = 20
+SYNC_TIME_CONCURRENCY = 4  # Pools whose clock is written at the same time
+SYNC_TIME_TIMEOUT = 30  # Seconds before a pool's clock sync is abandoned
 
 # Options flow keys
 CONF_HEALTH_CHECK_INTERVAL = "health_check_interval"
+CONF_COALESCE_WINDOW = "coalesce_window"
+CONF_CLOCK_DRIFT_THRESHOLD = "clock_drift_threshold"
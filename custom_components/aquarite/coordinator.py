@@ -2,21 +2,150 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from collections.abc import Iterator, Mapping
 import contextlib
+from datetime import datetime
+import json
 import logging
-from typing import Any
+import statistics
+import threading
+import time
+from typing import TYPE_CHECKING, Any
 
-from aioaquarite import AquariteAuth, AquariteClient
+from aioaquarite import AuthenticationError
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
-from .const import CONF_HEALTH_CHECK_INTERVAL, DEFAULT_HEALTH_CHECK_INTERVAL
+from .commands import AquariteCommandQueue, AquaritePendingTargets
+from .const import (
+    CLOCK_DRIFT_MIN_SAMPLES,
+    CLOCK_DRIFT_SAMPLES,
+    CLOCK_SYNC_MIN_INTERVAL,
+    CONF_CLOCK_DRIFT_THRESHOLD,
+    CONF_COALESCE_WINDOW,
+    CONF_HEALTH_CHECK_INTERVAL,
+    CONFIRM_TIMEOUT,
+    CONNECTION_AUTH_FAILED,
+    CONNECTION_BACKOFF,
+    CONNECTION_CONNECTING,
+    CONNECTION_LIVE,
+    CONNECTION_RESUBSCRIBING,
+    CONNECTION_STALE,
+    CONNECTION_STATES,
+    DEFAULT_CLOCK_DRIFT_THRESHOLD,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_HEALTH_CHECK_INTERVAL,
+    DOMAIN,
+    LATENCY_CLOUD,
+    LATENCY_FANOUT,
+    LATENCY_HANDOFF,
+    LATENCY_STAGES,
+    POOL_PRIVATE_KEYS,
+    RECONCILIATION_TIMEOUT,
+    STALENESS_FACTOR,
+    STALENESS_MIN,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    URGENT_PATHS,
+)
+from .latency import AquariteLatencyHistogram
+from .snapshot import SnapshotDiff, diff_snapshots, fingerprint, normalize
+
+if TYPE_CHECKING:
+    from .account import AquariteAccount
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNRESOLVED = object()
+
+
+class AquariteNotConfirmedError(TimeoutError):
+    """Values were written but no snapshot reported them in time."""
+
+
+# Connection states that end when the stream delivers a snapshot
+_AWAITING_SNAPSHOT = frozenset(
+    {CONNECTION_STALE, CONNECTION_RESUBSCRIBING, CONNECTION_BACKOFF}
+)
+
+# (listeners by exact path, listeners by path or ancestor, unindexed listeners)
+_ListenerIndex = tuple[
+    dict[str, list[CALLBACK_TYPE]], dict[str, list[CALLBACK_TYPE]], list[CALLBACK_TYPE]
+]
+
+
+def _controller_timestamp(now: datetime) -> int:
+    """Return a time as the controller encodes it: local wall clock as epoch."""
+    offset = now.utcoffset()
+    return int(now.timestamp()) + (int(offset.total_seconds()) if offset else 0)
+
+
+def _walk(data: Any, keys: tuple[str, ...]) -> Any:
+    """Walk nested dicts along pre-split keys, returning _UNRESOLVED if absent."""
+    current = data
+    for key in keys:
+        if isinstance(current, dict) and key in current:
+            current = current[key]
+        else:
+            return _UNRESOLVED
+    return current
+
+
+def _without_keys(data: Any, keys: frozenset[str]) -> Any:
+    """Return a copy of nested data with the given keys left out."""
+    if isinstance(data, dict):
+        return {
+            key: _without_keys(value, keys)
+            for key, value in data.items()
+            if key not in keys
+        }
+    if isinstance(data, list):
+        return [_without_keys(value, keys) for value in data]
+    return data
+
+
+class AquaritePathRegistry:
+    """Compiled dot-notation paths with values memoized per snapshot.
+
+    Each path is split into a key tuple the first time it is seen and kept
+    for the lifetime of the coordinator.  Resolved values are cached until
+    the coordinator data is replaced by a new snapshot, so the ~60 entity
+    properties evaluated after an update only walk each path once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._keys: dict[str, tuple[str, ...]] = {}
+        self._values: dict[str, Any] = {}
+        self._source: Any = None
+        self.generation = 0
+
+    def compile(self, path: str) -> tuple[str, ...]:
+        """Return the key tuple for a path, compiling it on first use."""
+        keys = self._keys.get(path)
+        if keys is None:
+            keys = self._keys[path] = tuple(path.split("."))
+        return keys
+
+    def resolve(self, data: Any, path: str, default: Any = None) -> Any:
+        """Return the value at path in data, memoized for this snapshot."""
+        if data is not self._source:
+            self._source = data
+            self._values.clear()
+            self.generation += 1
+        try:
+            value = self._values[path]
+        except KeyError:
+            value = self._values[path] = _walk(data, self.compile(path))
+        return default if value is _UNRESOLVED else value
+
 
 class AquariteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Aquarite coordinator using Firestore real-time snapshots."""
@@ -25,18 +154,66 @@ class AquariteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self,
         hass: HomeAssistant,
         entry: ConfigEntry,
-        auth: AquariteAuth,
-        api: AquariteClient,
+        account: AquariteAccount,
         pool_id: str,
     ) -> None:
         """Initialize the coordinator."""
-        self.auth = auth
-        self.api = api
+        self.account = account
+        self.auth = account.auth
+        self.api = account.api
         self.pool_id: str = pool_id
-        self.watch: Any | None = None
-        self._health_task: asyncio.Task[None] | None = None
-        self._token_task: asyncio.Task[None] | None = None
-        self._subscription_lock = asyncio.Lock()
+        self.commands = AquariteCommandQueue(
+            hass, account.api, pool_id, self.get_value
+        )
+        self.targets = AquaritePendingTargets(
+            hass, RECONCILIATION_TIMEOUT, self._async_notify_paths
+        )
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+        )
+        self.paths = AquaritePathRegistry()
+        self.last_diff: SnapshotDiff | None = None
+        self._dispatch_diff: SnapshotDiff | None = None
+
+        # Snapshot handoff from the Firestore thread; only the newest
+        # pending document is kept and flushed once per coalesce window.
+        self._pending_lock = threading.Lock()
+        # (document, diff, document the diff was computed against, arrival)
+        self._pending: (
+            tuple[dict[str, Any], SnapshotDiff, dict[str, Any] | None, float] | None
+        ) = None
+        self._flush_scheduled = False
+        self._cancel_flush: CALLBACK_TYPE | None = None
+        self._urgent_keys = tuple(self.paths.compile(path) for path in URGENT_PATHS)
+        self._last_fingerprint: bytes | None = None
+        self.snapshots_received = 0
+        self.snapshots_duplicate = 0
+        # Stream liveness, written on the Firestore thread (time.monotonic())
+        self.last_snapshot_at: float | None = None
+        self.last_snapshot_time: datetime | None = None  # wall clock
+        self.snapshot_interval: float | None = None  # smoothed cadence
+        # Per-stage delivery latency (see LATENCY_STAGES)
+        self.latency = {stage: AquariteLatencyHistogram() for stage in LATENCY_STAGES}
+        self._listener_index: _ListenerIndex | None = None
+        # Data restored from the store, until the first live document
+        self.from_cache = False
+        self.cache_saved_at: datetime | None = None
+        # Connection state machine; entries per state and when last entered
+        now = dt_util.utcnow()
+        self.connection_state = CONNECTION_CONNECTING
+        self.connection_since = now
+        self.connection_transitions = dict.fromkeys(CONNECTION_STATES, 0)
+        self.connection_transitions[CONNECTION_CONNECTING] = 1
+        self.connection_entered: dict[str, datetime] = {CONNECTION_CONNECTING: now}
+        self.connection_signal = f"{DOMAIN}_connection_{pool_id}"
+        # Controller clock drift (controller minus HA local time, seconds)
+        self._drift_samples: deque[int] = deque(maxlen=CLOCK_DRIFT_SAMPLES)
+        self.clock_drift: int | None = None
+        self._last_clock_sync: float | None = None
+        # path -> (awaited value, future) pairs of set_and_confirm callers
+        self._confirm_waiters: dict[
+            str, list[tuple[Any, asyncio.Future[None]]]
+        ] = {}
 
         super().__init__(
             hass,
@@ -46,85 +223,556 @@ class AquariteDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             config_entry=entry,
         )
 
-    async def subscribe(self) -> None:
-        """Subscribe to Firestore real-time updates via the library."""
+    async def async_load_cache(self) -> dict[str, Any] | None:
+        """Return the last persisted snapshot for this pool, if any.
 
-        def _on_data(data: dict[str, Any]) -> None:
-            """Callback from Firestore thread; push data to HA loop."""
-            self.hass.loop.call_soon_threadsafe(self.async_set_updated_data, data)
+        Entities built from it report an assumed state until live data
+        arrives (see ``from_cache``).
+        """
+        stored = await self._store.async_load()
+        if not stored or stored.get("pool_id") != self.pool_id:
+            return None
+        self.from_cache = True
+        self.cache_saved_at = dt_util.parse_datetime(stored.get("saved_at") or "")
+        return stored.get("data")
 
-        self.watch = await self.api.subscribe_pool(self.pool_id, _on_data)
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the JSON-safe payload persisted for fast startup.
 
-    async def setup_tasks(self) -> None:
-        """Start background health monitoring and token refresh."""
-        self._health_task = self.hass.async_create_background_task(
-            self.periodic_health_check(), "Aquarite health check"
-        )
-        self._token_task = self.hass.async_create_background_task(
-            self._token_refresh_loop(), "Aquarite token refresh"
+        Personal fields (address, location, email) are left out.
+        """
+        return {
+            "pool_id": self.pool_id,
+            "saved_at": dt_util.utcnow().isoformat(),
+            "data": json.loads(
+                json.dumps(_without_keys(self.data, POOL_PRIVATE_KEYS), default=str)
+            ),
+        }
+
+    async def async_connect(self) -> None:
+        """Authenticate, fetch the pool document and start live updates."""
+        self.async_set_connection_state(CONNECTION_CONNECTING)
+        await self.account.async_authenticate()
+        self.async_set_updated_data(
+            normalize(await self.api.fetch_pool_data(self.pool_id))
         )
+        self.last_snapshot_at = time.monotonic()
+        self.last_snapshot_time = dt_util.now()
+        await self.subscribe()
+        self.async_set_connection_state(CONNECTION_LIVE)
 
-    async def _token_refresh_loop(self) -> None:
-        """Maintain token validity with exponential backoff on error."""
-        retry_delay = 10
+    async def async_connect_in_background(self) -> None:
+        """Connect while entities run from the cached snapshot.
+
+        Transient failures are retried once the account's circuit breaker
+        lets calls through again; invalid credentials start a reauth flow.
+        """
         while not self.hass.is_stopping:
             try:
-                if self.auth.is_token_expiring():
-                    _LOGGER.debug("Token expiring soon, refreshing...")
-                    _, refreshed = await self.auth.get_client()
-                    if refreshed:
-                        await self.refresh_subscription()
-                retry_delay = 10
-                sleep_time = self.auth.calculate_sleep_duration()
-                await asyncio.sleep(sleep_time)
+                async with self.account.breaker.async_attempt():
+                    await self.async_connect()
+            except AuthenticationError:
+                _LOGGER.error("Authentication failed for pool %s", self.pool_id)
+                self.async_set_connection_state(CONNECTION_AUTH_FAILED)
+                self.config_entry.async_start_reauth(self.hass)
+                return
             except Exception as err:
-                _LOGGER.error(
-                    "Error maintaining token: %s. Retrying in %ss", err, retry_delay
-                )
-                await asyncio.sleep(retry_delay)
-                retry_delay = min(retry_delay * 2, 600)
+                _LOGGER.warning("Unable to connect pool %s: %s", self.pool_id, err)
+                self.async_set_connection_state(CONNECTION_BACKOFF)
+            else:
+                return
 
-    async def periodic_health_check(self) -> None:
-        """Monitor connection and resubscribe if needed."""
-        while not self.hass.is_stopping:
-            interval = self.config_entry.options.get(
-                CONF_HEALTH_CHECK_INTERVAL, DEFAULT_HEALTH_CHECK_INTERVAL
+    async def subscribe(self) -> None:
+        """Subscribe to Firestore real-time updates through the account."""
+        await self.account.watches.async_attach(self.pool_id, self._on_data)
+
+    def _on_data(self, data: dict[str, Any]) -> None:
+        """Callback from Firestore thread; hand the snapshot to the HA loop.
+
+        All per-snapshot CPU work happens here, off the event loop: documents
+        identical to the previous delivery are dropped, numeric strings are
+        coerced and the diff against the dispatched document is computed, so
+        the loop only applies a ready delta.  Bursts are coalesced: only the
+        newest pending document is kept and a single flush is scheduled per
+        window.  Snapshots that change an alarm path are flushed immediately.
+        """
+        self.last_snapshot_time = dt_util.now()
+        arrived = time.monotonic()
+        self._record_arrival(arrived)
+        if self.connection_state in _AWAITING_SNAPSHOT:
+            self.hass.loop.call_soon_threadsafe(self._async_snapshot_arrived)
+        digest = fingerprint(data)
+        with self._pending_lock:
+            self.snapshots_received += 1
+            if digest == self._last_fingerprint:
+                self.snapshots_duplicate += 1
+                return
+            self._last_fingerprint = digest
+        data = normalize(data)
+        base = self.data
+        diff = diff_snapshots(base, data)
+        urgent = self._is_urgent(data, base)
+        with self._pending_lock:
+            self._pending = (data, diff, base, arrived)
+            if self._flush_scheduled and not urgent:
+                return
+            self._flush_scheduled = True
+        self.hass.loop.call_soon_threadsafe(
+            self._async_schedule_flush, urgent, time.monotonic()
+        )
+
+    def _record_arrival(self, now: float) -> None:
+        """Timestamp a delivery and fold its gap into the pool's cadence."""
+        last = self.last_snapshot_at
+        if last is not None:
+            gap = now - last
+            previous = self.snapshot_interval
+            self.snapshot_interval = (
+                gap if previous is None else 0.8 * previous + 0.2 * gap
             )
-            await asyncio.sleep(interval)
-            try:
-                await self.auth.get_client()
-            except Exception as err:
-                _LOGGER.error("Health check failed, resubscribing: %s", err)
-                await self.refresh_subscription()
+        self.last_snapshot_at = now
+
+    def stale_after(self) -> float:
+        """Return how long the stream may stay silent before it is restarted.
+
+        A few times the pool's observed cadence, bounded below by
+        STALENESS_MIN and above by the health check interval option.
+        """
+        ceiling = self.config_entry.options.get(
+            CONF_HEALTH_CHECK_INTERVAL, DEFAULT_HEALTH_CHECK_INTERVAL
+        )
+        if self.snapshot_interval is None:
+            return ceiling
+        return min(
+            max(self.snapshot_interval * STALENESS_FACTOR, STALENESS_MIN), ceiling
+        )
+
+    def seconds_since_snapshot(self, now: float | None = None) -> float | None:
+        """Return the seconds since the last delivery from the stream."""
+        if self.last_snapshot_at is None:
+            return None
+        return (time.monotonic() if now is None else now) - self.last_snapshot_at
+
+    def is_stale(self, now: float, watch_started_at: float | None) -> bool:
+        """Return true if nothing arrived since the watch or last snapshot."""
+        since = max(
+            (t for t in (self.last_snapshot_at, watch_started_at) if t is not None),
+            default=None,
+        )
+        return since is not None and now - since > self.stale_after()
+
+    def _is_urgent(self, data: dict[str, Any], base: dict[str, Any] | None) -> bool:
+        """Return true if an alarm path differs from the dispatched data."""
+        if base is None:
+            return True
+        return any(_walk(data, keys) != _walk(base, keys) for keys in self._urgent_keys)
+
+    @callback
+    def _async_schedule_flush(self, urgent: bool, handed_off: float) -> None:
+        """Flush now or once the coalesce window has elapsed."""
+        self.latency[LATENCY_HANDOFF].record(time.monotonic() - handed_off)
+        window = (
+            self.config_entry.options.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW)
+            / 1000
+        )
+        if urgent or window <= 0:
+            self._async_flush_pending()
+        elif self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self.hass, window, self._async_flush_pending
+            )
+
+    @callback
+    def _async_flush_pending(self, *_: Any) -> None:
+        """Dispatch the newest pending snapshot, if any."""
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        with self._pending_lock:
+            pending, self._pending = self._pending, None
+            self._flush_scheduled = False
+        if pending is None:
+            return
+        data, diff, base, arrived = pending
+        if base is not self.data:
+            # The dispatched document moved on while the diff was computed.
+            diff = diff_snapshots(self.data, data)
+        self._async_apply_snapshot(data, diff)
+        # Cloud round trip: accepted write to the snapshot reporting it.
+        for accepted in self.commands.async_take_echoes(
+            lambda path: self.paths.resolve(data, path, _UNRESOLVED)
+        ):
+            self.latency[LATENCY_CLOUD].record(arrived - accepted)
 
     async def refresh_subscription(self) -> None:
-        """Resubscribe to Firestore after a token refresh."""
-        async with self._subscription_lock:
-            _LOGGER.debug("Refreshing Firestore subscription for %s", self.pool_id)
-            if self.watch:
-                await asyncio.to_thread(self.watch.unsubscribe)
-            await self.subscribe()
+        """Rebuild this pool's watch, for example after a stalled stream.
+
+        The pool only counts as live again once a snapshot arrives; a stale
+        pool stays stale until then.
+        """
+        _LOGGER.debug("Refreshing Firestore subscription for %s", self.pool_id)
+        async with self.account.breaker.async_attempt():
+            if self.connection_state != CONNECTION_STALE:
+                self.async_set_connection_state(CONNECTION_RESUBSCRIBING)
+            try:
+                await self.account.watches.async_resubscribe((self.pool_id,))
+            except AuthenticationError:
+                self.async_set_connection_state(CONNECTION_AUTH_FAILED)
+                raise
+            except Exception:
+                self.async_set_connection_state(CONNECTION_BACKOFF)
+                raise
+
+    @callback
+    def _async_snapshot_arrived(self) -> None:
+        """Mark a pool waiting for its stream as live again."""
+        if self.connection_state in _AWAITING_SNAPSHOT:
+            self.async_set_connection_state(CONNECTION_LIVE)
+
+    @callback
+    def async_set_connection_state(self, state: str) -> None:
+        """Move the connection state machine and record the transition."""
+        if state == self.connection_state:
+            return
+        _LOGGER.debug(
+            "Pool %s connection %s -> %s", self.pool_id, self.connection_state, state
+        )
+        now = dt_util.utcnow()
+        self.connection_state = state
+        self.connection_since = now
+        self.connection_transitions[state] += 1
+        self.connection_entered[state] = now
+        async_dispatcher_send(self.hass, self.connection_signal)
 
     async def async_shutdown(self) -> None:
-        """Cleanly unsubscribe and cancel tasks."""
-        if self.watch:
-            await asyncio.to_thread(self.watch.unsubscribe)
-        for task in (self._health_task, self._token_task):
-            if task:
-                task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await task
+        """Cleanly unsubscribe and persist the latest snapshot."""
+        await self.account.watches.async_detach(self.pool_id)
+        await self.commands.async_shutdown()
+        self.targets.async_clear()
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        if self.data is not None:
+            await self._store.async_save(self._data_to_store())
         await super().async_shutdown()
 
+    @callback
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Store a new snapshot and notify only the entities it affects."""
+        self._async_apply_snapshot(data, diff_snapshots(self.data, data))
+
+    @callback
+    def _async_apply_snapshot(self, data: dict[str, Any], diff: SnapshotDiff) -> None:
+        """Apply a snapshot with its precomputed diff.
+
+        The diff is kept in ``last_diff`` for platforms and diagnostics.
+        """
+        previous = self.data
+        self.last_diff = diff
+        # The first live document refreshes every entity out of assumed state.
+        was_cached, self.from_cache = self.from_cache, False
+        if self.targets:
+            self.targets.confirm(
+                lambda path: self.paths.resolve(data, path, _UNRESOLVED)
+            )
+        if previous is not None and "main.localTime" in diff.changed:
+            self._async_track_clock(data)
+        if previous is not None and self.last_update_success and not was_cached:
+            self._dispatch_diff = diff
+        started = time.monotonic()
+        try:
+            super().async_set_updated_data(data)
+        finally:
+            self._dispatch_diff = None
+        self.latency[LATENCY_FANOUT].record(time.monotonic() - started)
+        if self._confirm_waiters:
+            self._async_resolve_waiters(data)
+        self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _async_track_clock(self, data: dict[str, Any]) -> None:
+        """Update the drift estimate from a freshly reported controller clock.
+
+        The estimate is the median of the last few samples, so a single
+        late delivery does not trigger a sync.  Past the configured
+        threshold the clock is synced, at most once per
+        CLOCK_SYNC_MIN_INTERVAL.
+        """
+        try:
+            controller_time = int(self.paths.resolve(data, "main.localTime"))
+        except (TypeError, ValueError):
+            return
+        self._drift_samples.append(
+            controller_time - _controller_timestamp(dt_util.now())
+        )
+        self.clock_drift = int(statistics.median(self._drift_samples))
+
+        threshold = self.config_entry.options.get(
+            CONF_CLOCK_DRIFT_THRESHOLD, DEFAULT_CLOCK_DRIFT_THRESHOLD
+        )
+        if (
+            not threshold
+            or abs(self.clock_drift) <= threshold
+            or len(self._drift_samples) < CLOCK_DRIFT_MIN_SAMPLES
+        ):
+            return
+        now = time.monotonic()
+        if (
+            self._last_clock_sync is not None
+            and now - self._last_clock_sync < CLOCK_SYNC_MIN_INTERVAL
+        ):
+            return
+        self._last_clock_sync = now
+        _LOGGER.info(
+            "Pool %s clock is %+ds off, syncing", self.pool_id, self.clock_drift
+        )
+        self.config_entry.async_create_background_task(
+            self.hass, self._async_correct_clock(), "Aquarite clock sync"
+        )
+
+    async def _async_correct_clock(self) -> None:
+        """Sync the controller clock, logging a failure."""
+        try:
+            await self.set_pool_time_to_now()
+        except Exception as err:
+            _LOGGER.warning(
+                "Automatic clock sync of %s failed: %s", self.pool_id, err
+            )
+
+    @callback
+    def _async_resolve_waiters(self, data: dict[str, Any]) -> None:
+        """Wake set_and_confirm callers whose value a snapshot reports."""
+        for path, waiters in self._confirm_waiters.items():
+            reported = self.paths.resolve(data, path, _UNRESOLVED)
+            for value, future in waiters:
+                if reported == value and not future.done():
+                    future.set_result(None)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates, indexing the listener by its value paths.
+
+        Entities pass the frozenset of dotted paths they read as context;
+        listeners without one are notified on every update.
+        """
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._listener_index = None
+
+        @callback
+        def _remove_listener() -> None:
+            remove_listener()
+            self._listener_index = None
+
+        return _remove_listener
+
+    def _build_listener_index(self) -> _ListenerIndex:
+        """Index listeners by exact path and by every ancestor of their paths."""
+        exact: dict[str, list[CALLBACK_TYPE]] = {}
+        subtree: dict[str, list[CALLBACK_TYPE]] = {}
+        unindexed: list[CALLBACK_TYPE] = []
+        for update_callback, context in self._listeners.values():
+            if not isinstance(context, frozenset):
+                unindexed.append(update_callback)
+                continue
+            for path in context:
+                exact.setdefault(path, []).append(update_callback)
+                keys = self.paths.compile(path)
+                for depth in range(1, len(keys) + 1):
+                    subtree.setdefault(".".join(keys[:depth]), []).append(
+                        update_callback
+                    )
+        return exact, subtree, unindexed
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners whose paths changed in the latest snapshot."""
+        diff = self._dispatch_diff
+        if diff is None:
+            super().async_update_listeners()
+            return
+
+        if self._listener_index is None:
+            self._listener_index = self._build_listener_index()
+        exact, subtree, unindexed = self._listener_index
+
+        # A listener is affected when a changed path is its own path, one of
+        # its ancestors (subtree replaced) or one of its descendants.
+        affected: dict[CALLBACK_TYPE, None] = dict.fromkeys(unindexed)
+        for path in diff.paths:
+            affected.update(dict.fromkeys(subtree.get(path, ())))
+            keys = self.paths.compile(path)
+            for depth in range(1, len(keys)):
+                affected.update(dict.fromkeys(exact.get(".".join(keys[:depth]), ())))
+
+        for update_callback in affected:
+            update_callback()
+
     def get_value(self, path: str, default: Any = None) -> Any:
-        """Get nested data using dot-notation path."""
-        return AquariteClient.get_value(self.data, path, default)
+        """Get nested data using dot-notation path.
+
+        This is the value the latest snapshot reports; pending writes are
+        ignored.
+        """
+        return self.paths.resolve(self.data, path, default)
+
+    def get_display_value(self, path: str, default: Any = None) -> Any:
+        """Get the value an entity writing path should show.
+
+        A value written but not yet confirmed by a snapshot is returned in
+        place of the reported one.
+        """
+        if self.targets:
+            target = self.targets.get(path, _UNRESOLVED)
+            if target is not _UNRESOLVED:
+                return target
+        return self.paths.resolve(self.data, path, default)
+
+    @callback
+    def _async_notify_paths(self, paths: frozenset[str]) -> None:
+        """Notify the listeners of paths whose displayed value changed."""
+        self._dispatch_diff = SnapshotDiff(changed=paths)
+        try:
+            self.async_update_listeners()
+        finally:
+            self._dispatch_diff = None
+
+    async def async_set_value(self, path: str, value: Any) -> bool:
+        """Write a value, showing it optimistically until confirmed.
+
+        The write goes through the command queue; if it fails or is
+        cancelled the target is dropped and the reported value is shown
+        again.  Returns false if the queue skipped the write because the
+        pool already holds the value.
+        """
+        token = self.targets.set(path, value)
+        self._async_notify_paths(frozenset((path,)))
+        try:
+            sent = await self.commands.async_write(path, value)
+        except BaseException:
+            if self.targets.discard(path, token):
+                self._async_notify_paths(frozenset((path,)))
+            raise
+        # A skipped write has nothing left to confirm.
+        if not sent:
+            self.targets.discard(path, token)
+        return sent
+
+    async def set_and_confirm(
+        self, path: str, value: Any, timeout: float = CONFIRM_TIMEOUT
+    ) -> None:
+        """Write a value and return once a snapshot reports it.
+
+        Raises AquariteNotConfirmedError if no snapshot confirms the value
+        in time.
+        """
+        # Register first so a snapshot racing the write is not missed.
+        with self._confirm_waiter(path, value) as future:
+            if await self.async_set_value(path, value):
+                await self._async_wait_confirmed({path: future}, timeout)
+
+    @contextlib.contextmanager
+    def _confirm_waiter(
+        self, path: str, value: Any
+    ) -> Iterator[asyncio.Future[None]]:
+        """Register a future resolved once a snapshot reports a value."""
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        waiter = (value, future)
+        self._confirm_waiters.setdefault(path, []).append(waiter)
+        try:
+            yield future
+        finally:
+            waiters = self._confirm_waiters[path]
+            waiters.remove(waiter)
+            if not waiters:
+                del self._confirm_waiters[path]
+
+    async def _async_wait_confirmed(
+        self, futures: Mapping[str, asyncio.Future[None]], timeout: float
+    ) -> None:
+        """Wait for confirmation futures, naming the paths that timed out."""
+        if not futures:
+            return
+        await asyncio.wait(futures.values(), timeout=timeout)
+        if missing := [path for path, future in futures.items() if not future.done()]:
+            raise AquariteNotConfirmedError(
+                f"{', '.join(missing)} not reported by the pool within {timeout:g}s"
+            )
+
+    async def async_set_values(
+        self,
+        values: Mapping[str, Any],
+        *,
+        confirm: bool = False,
+        rollback: bool = False,
+    ) -> None:
+        """Write several values in one batch.
+
+        The API writes each field on its own, so a batch is not atomic.
+        The first write failure is raised after all writes settle; with
+        ``rollback`` the values the pool reported before the batch are
+        first written back, on a best-effort basis.  With ``confirm`` this
+        then waits until snapshots report every value, raising
+        AquariteNotConfirmedError otherwise; the writes succeeded, so a
+        slow confirmation is never rolled back.
+        """
+        previous = {path: self.get_value(path) for path in values}
+        with contextlib.ExitStack() as stack:
+            futures = {
+                path: stack.enter_context(self._confirm_waiter(path, value))
+                for path, value in values.items()
+                if confirm
+            }
+            results = await asyncio.gather(
+                *(self.async_set_value(path, value) for path, value in values.items()),
+                return_exceptions=True,
+            )
+            error = next(
+                (result for result in results if isinstance(result, BaseException)),
+                None,
+            )
+            if error is not None:
+                if rollback:
+                    await self._async_restore(previous)
+                raise error
+            if confirm:
+                # Skipped writes have nothing to confirm.
+                await self._async_wait_confirmed(
+                    {
+                        path: future
+                        for (path, future), sent in zip(futures.items(), results)
+                        if sent
+                    },
+                    CONFIRM_TIMEOUT,
+                )
+
+    async def _async_restore(self, values: Mapping[str, Any]) -> None:
+        """Write back values after a failed batch, logging what cannot be."""
+        values = {path: value for path, value in values.items() if value is not None}
+        _LOGGER.warning("Restoring %s of pool %s", list(values), self.pool_id)
+        results = await asyncio.gather(
+            *(self.async_set_value(path, value) for path, value in values.items()),
+            return_exceptions=True,
+        )
+        for path, result in zip(values, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Could not restore %s of pool %s: %s", path, self.pool_id, result
+                )
 
     async def set_pool_time_to_now(self) -> None:
         """Sync the pool controller clock with the current time."""
         now = dt_util.now()
         offset = now.utcoffset()
         utc_offset = int(offset.total_seconds()) if offset else 0
-        timestamp = int(now.timestamp()) + utc_offset
+        timestamp = _controller_timestamp(now)
         _LOGGER.info("Syncing pool localTime to: %s (%s, UTC offset %+ds)", timestamp, now.isoformat(), utc_offset)
-        await self.api.set_value(self.pool_id, "main.localTime", timestamp)
+        # The clock keeps running, so no snapshot ever reports exactly the
+        # value written: send it without an optimistic target to confirm.
+        await self.commands.async_write("main.localTime", timestamp)
+        # Samples taken before the sync describe the old clock.
+        self._drift_samples.clear()
+        self.clock_drift = None
+        self._async_notify_paths(frozenset(("main.localTime",)))
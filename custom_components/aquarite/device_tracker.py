@@ -46,6 +46,11 @@ class PoolLocationDeviceTracker(AquariteEntity, TrackerEntity):
         super().__init__(coordinator, pool_id, pool_name)
         self._attr_unique_id = self.build_unique_id("location-tracker")
 
+    @property
+    def value_paths(self) -> frozenset[str]:
+        """Return the form paths holding the coordinates."""
+        return frozenset(("form.lat", "form.lng"))
+
     @property
     def latitude(self) -> float | None:
         """Return latitude directly from coordinator data."""
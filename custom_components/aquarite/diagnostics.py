@@ -8,9 +8,10 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 
 from . import AquariteConfigEntry
+from .const import POOL_PRIVATE_KEYS
 
 TO_REDACT_CONFIG = {CONF_USERNAME, CONF_PASSWORD}
-TO_REDACT_COORDINATOR = {"city", "street", "zipcode", "lat", "lng", "email"}
+TO_REDACT_COORDINATOR = POOL_PRIVATE_KEYS
 
 
 async def async_get_config_entry_diagnostics(
@@ -27,4 +28,34 @@ async def async_get_config_entry_diagnostics(
         "coordinator_data": async_redact_data(
             coordinator.data or {}, TO_REDACT_COORDINATOR
         ),
+        "last_diff": coordinator.last_diff.as_dict() if coordinator.last_diff else None,
+        "pending_targets": coordinator.targets.as_dict(),
+        "clock_drift": coordinator.clock_drift,
+        "circuit_breaker": entry.runtime_data.account.breaker.as_dict(),
+        "connection": {
+            "state": coordinator.connection_state,
+            "since": coordinator.connection_since.isoformat(),
+            "transitions": coordinator.connection_transitions,
+            "last_entered": {
+                state: entered.isoformat()
+                for state, entered in coordinator.connection_entered.items()
+            },
+        },
+        "latency": {
+            stage: histogram.as_dict()
+            for stage, histogram in coordinator.latency.items()
+        },
+        "snapshots": {
+            "received": coordinator.snapshots_received,
+            "duplicates_dropped": coordinator.snapshots_duplicate,
+            "seconds_since_last": coordinator.seconds_since_snapshot(),
+            "interval": coordinator.snapshot_interval,
+            "stale_after": coordinator.stale_after(),
+            "from_cache": coordinator.from_cache,
+            "cache_saved_at": (
+                coordinator.cache_saved_at.isoformat()
+                if coordinator.cache_saved_at
+                else None
+            ),
+        },
     }
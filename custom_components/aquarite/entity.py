@@ -12,6 +12,7 @@ class AquariteEntity(CoordinatorEntity[AquariteDataUpdateCoordinator]):
     """Base entity class for Aquarite platforms."""
 
     _attr_has_entity_name = True
+    _value_path: str | None = None
 
     def __init__(
         self,
@@ -32,6 +33,27 @@ class AquariteEntity(CoordinatorEntity[AquariteDataUpdateCoordinator]):
             sw_version=str(sw_version) if sw_version else None,
         )
 
+    @property
+    def value_paths(self) -> frozenset[str] | None:
+        """Return the data paths this entity's state is derived from.
+
+        The coordinator only notifies the entity when one of these paths
+        changes.  ``None`` subscribes the entity to every update.
+        """
+        if self._value_path is None:
+            return None
+        return frozenset((self._value_path,))
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return true while the state comes from the stored snapshot."""
+        return self.coordinator.from_cache
+
+    async def async_added_to_hass(self) -> None:
+        """Register with the coordinator for the entity's value paths."""
+        self.coordinator_context = self.value_paths
+        await super().async_added_to_hass()
+
     @property
     def pool_id(self) -> str:
         """Return the pool ID for the entity."""
@@ -0,0 +1,70 @@
+"""Snapshot latency histograms for the Aquarite integration."""
+from __future__ import annotations
+
+from bisect import bisect_left
+import math
+import threading
+from typing import Any
+
+from .const import LATENCY_BUCKETS
+
+
+class AquariteLatencyHistogram:
+    """Fixed-bucket histogram of latencies in seconds.
+
+    Memory does not grow with the number of samples: each sample only
+    bumps the counter of the first bucket whose upper bound holds it.
+    Quantiles are therefore approximate, reported as that bucket's bound
+    (or the largest sample seen, for the open-ended last bucket).
+    Samples may be recorded from the Firestore thread.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize an empty histogram."""
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a sample; negative ones (clock skew) count as zero."""
+        seconds = max(seconds, 0.0)
+        with self._lock:
+            self._counts[bisect_left(self._bounds, seconds)] += 1
+            self.count += 1
+            self.total += seconds
+            self.maximum = max(self.maximum, seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Return the approximate ``q`` quantile, or None without samples."""
+        with self._lock:
+            if not self.count:
+                return None
+            rank = max(math.ceil(q * self.count), 1)
+            seen = 0
+            for index, bucket in enumerate(self._counts):
+                seen += bucket
+                if seen >= rank:
+                    break
+            if index == len(self._bounds):
+                return self.maximum
+            return min(self._bounds[index], self.maximum)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram summary and buckets for diagnostics."""
+        with self._lock:
+            counts = list(self._counts)
+            count, total, maximum = self.count, self.total, self.maximum
+        buckets = {f"le_{bound:g}": n for bound, n in zip(self._bounds, counts)}
+        buckets["inf"] = counts[-1]
+        return {
+            "count": count,
+            "mean": total / count if count else None,
+            "max": maximum if count else None,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
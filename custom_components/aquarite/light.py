@@ -1,7 +1,6 @@
-"""Aquarite Light entity with State Reconciliation and Failure Handling."""
+"""Aquarite Light entity."""
 from __future__ import annotations
 
-import time
 from typing import Any
 
 from homeassistant.components.light import ColorMode, LightEntity
@@ -12,9 +11,6 @@ from . import AquariteConfigEntry
 from .coordinator import AquariteDataUpdateCoordinator
 from .entity import AquariteEntity
 
-# How long to wait for the cloud to confirm before reverting the UI
-RECONCILIATION_TIMEOUT = 20
-
 PARALLEL_UPDATES = 1
 
 
@@ -53,47 +49,14 @@ class AquariteLightEntity(AquariteEntity, LightEntity):
         self._attr_translation_key = translation_key
         self._attr_unique_id = self.build_unique_id(name)
 
-        # Reconciliation logic
-        self._target_state: bool | None = None
-        self._target_set_at: float = 0
-
     @property
     def is_on(self) -> bool:
         """Return true if light is on."""
-        actual_state = bool(self.coordinator.get_value(self._value_path))
-
-        # If we aren't waiting for a change, show actual state
-        if self._target_state is None:
-            return actual_state
-
-        # Check if the cloud has finally matched our request
-        if actual_state == self._target_state:
-            self._target_state = None
-            return actual_state
-
-        # Check if we've waited too long (Timeout)
-        if (time.monotonic() - self._target_set_at) > RECONCILIATION_TIMEOUT:
-            self._target_state = None
-            return actual_state
-
-        # Otherwise, stay optimistic
-        return self._target_state
+        return bool(self.coordinator.get_display_value(self._value_path))
 
     async def _send_command(self, state: bool) -> None:
-        """Set target state and trigger API."""
-        self._target_state = state
-        self._target_set_at = time.monotonic()
-        self.async_write_ha_state()
-
-        try:
-            await self.coordinator.api.set_value(
-                self._pool_id, self._value_path, 1 if state else 0
-            )
-        except Exception:
-            # If the API call fails immediately, reset and revert UI
-            self._target_state = None
-            self.async_write_ha_state()
-            raise
+        """Write the light state; the coordinator shows it until confirmed."""
+        await self.coordinator.async_set_value(self._value_path, 1 if state else 0)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
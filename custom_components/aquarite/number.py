@@ -10,10 +10,12 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AquariteConfigEntry
+from .const import NUMBER_SCALE_MAP
 from .coordinator import AquariteDataUpdateCoordinator
 from .entity import AquariteEntity
+from .settings import number_bounds
 
-PARALLEL_UPDATES = 1
+PARALLEL_UPDATES = 0
 
 
 async def async_setup_entry(
@@ -25,36 +27,22 @@ async def async_setup_entry(
     dataservice = entry.runtime_data.coordinator
     pool_id, pool_name = dataservice.pool_id, entry.title
 
-    # Safely determine max electrolysis
-    raw_max = dataservice.get_value("hidro.maxAllowedValue", 0)
-    try:
-        max_electrolysis = int(raw_max) / 10 if raw_max else 50.0
-    except (ValueError, TypeError):
-        max_electrolysis = 50.0
+    def number(name: str, translation_key: str, value_path: str) -> AquariteNumberEntity:
+        """Return a number entity ranged by its writable setting."""
+        value_min, value_max = number_bounds(dataservice, value_path)
+        return AquariteNumberEntity(
+            dataservice, pool_id, pool_name,
+            value_min, value_max, name, translation_key, value_path,
+        )
 
     entities = [
-        AquariteNumberEntity(
-            dataservice, pool_id, pool_name,
-            500, 800, "Redox Setpoint", "redox_setpoint", "modules.rx.status.value",
-        ),
-        AquariteNumberEntity(
-            dataservice, pool_id, pool_name,
-            6, 8, "pH Low", "ph_low", "modules.ph.status.low_value",
-        ),
-        AquariteNumberEntity(
-            dataservice, pool_id, pool_name,
-            6, 8, "pH Max", "ph_max", "modules.ph.status.high_value",
-        ),
-        AquariteNumberEntity(
-            dataservice, pool_id, pool_name,
-            0, max_electrolysis, "Electrolysis Setpoint", "electrolysis_setpoint", "hidro.level",
-        ),
+        number("Redox Setpoint", "redox_setpoint", "modules.rx.status.value"),
+        number("pH Low", "ph_low", "modules.ph.status.low_value"),
+        number("pH Max", "ph_max", "modules.ph.status.high_value"),
+        number("Electrolysis Setpoint", "electrolysis_setpoint", "hidro.level"),
         # INTEL mode target temperature (matches the "Température" field shown
         # under the INTEL slider position in the Hayward app).
-        AquariteNumberEntity(
-            dataservice, pool_id, pool_name,
-            5, 40, "Intel Mode Temperature", "intel_mode_temperature", "filtration.intel.temp",
-        ),
+        number("Intel Mode Temperature", "intel_mode_temperature", "filtration.intel.temp"),
     ]
 
     # HEAT mode min/max range (the two arrows under "Température minimale" /
@@ -64,14 +52,8 @@ async def async_setup_entry(
     # unchanged so existing unique_ids are preserved.
     if dataservice.get_value("filtration.hasHeat"):
         entities.extend([
-            AquariteNumberEntity(
-                dataservice, pool_id, pool_name,
-                5, 40, "Heating Setpoint", "heating_mode_min_temperature", "filtration.heating.temp",
-            ),
-            AquariteNumberEntity(
-                dataservice, pool_id, pool_name,
-                5, 40, "Heating High Setpoint", "heating_mode_max_temperature", "filtration.heating.tempHi",
-            ),
+            number("Heating Setpoint", "heating_mode_min_temperature", "filtration.heating.temp"),
+            number("Heating High Setpoint", "heating_mode_max_temperature", "filtration.heating.tempHi"),
         ])
 
     # SMART mode min/max range (replaces the read-only sensors that previously
@@ -79,14 +61,8 @@ async def async_setup_entry(
     # the breaking-change note).
     if dataservice.get_value("filtration.hasSmart"):
         entities.extend([
-            AquariteNumberEntity(
-                dataservice, pool_id, pool_name,
-                5, 40, "Smart Mode Min Temperature", "smart_mode_min_temperature", "filtration.smart.tempMin",
-            ),
-            AquariteNumberEntity(
-                dataservice, pool_id, pool_name,
-                5, 40, "Smart Mode Max Temperature", "smart_mode_max_temperature", "filtration.smart.tempHigh",
-            ),
+            number("Smart Mode Min Temperature", "smart_mode_min_temperature", "filtration.smart.tempMin"),
+            number("Smart Mode Max Temperature", "smart_mode_max_temperature", "filtration.smart.tempHigh"),
         ])
 
     async_add_entities(entities)
@@ -97,11 +73,7 @@ class AquariteNumberEntity(AquariteEntity, NumberEntity):
 
     _attr_entity_category = EntityCategory.CONFIG
 
-    SCALE_MAP: Final[dict[str, int]] = {
-        "modules.ph.status.low_value": 100,
-        "modules.ph.status.high_value": 100,
-        "hidro.level": 10,
-    }
+    SCALE_MAP: Final[dict[str, int]] = NUMBER_SCALE_MAP
     UNIT_MAP: Final[dict[str, str]] = {
         "modules.rx.status.value": "mV",
         "modules.ph.status.low_value": "pH",
@@ -151,7 +123,7 @@ class AquariteNumberEntity(AquariteEntity, NumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
-        raw_value = self.coordinator.get_value(self._value_path)
+        raw_value = self.coordinator.get_display_value(self._value_path)
         if raw_value is None:
             return None
         scale = self.SCALE_MAP.get(self._value_path)
@@ -160,10 +132,8 @@ class AquariteNumberEntity(AquariteEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
         scale = self.SCALE_MAP.get(self._value_path)
-        raw_value = int(value * scale) if scale else value
+        raw_value = round(value * scale) if scale else value
         try:
-            await self.coordinator.api.set_value(
-                self._pool_id, self._value_path, raw_value
-            )
+            await self.coordinator.async_set_value(self._value_path, raw_value)
         except Exception as err:
             raise HomeAssistantError(f"Failed to set value: {err}") from err
@@ -0,0 +1,144 @@
+"""Shared scheduler for the recurring background jobs of the Aquarite integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import logging
+import random
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, SCHEDULER_JITTER, SCHEDULER_RETRY_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+# Runs a job once and returns the seconds until its next run, or None to stop.
+AquariteJob = Callable[[], Awaitable[float | None]]
+
+
+@dataclass(eq=False)
+class _ScheduledJob:
+    """A recurring job and its run state."""
+
+    name: str
+    job: AquariteJob
+    delay: float
+    cancelled: bool = False
+    task: asyncio.Task[None] | None = field(default=None, repr=False)
+
+
+class AquariteScheduler:
+    """One timer driving every recurring job of every account.
+
+    Jobs are kept in a heap ordered by deadline and a single loop timer
+    is armed for the earliest one, so nothing sleeps in between and the
+    cost stays flat however many entries are loaded.  Each delay is
+    shortened by a random fraction of up to SCHEDULER_JITTER, so jobs
+    started together (all entries load at once) drift apart instead of
+    firing in lockstep.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        # (loop time when due, tie breaker, job)
+        self._queue: list[tuple[float, int, _ScheduledJob]] = []
+        self._sequence = itertools.count()
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._timer_deadline: float | None = None
+
+    def __len__(self) -> int:
+        """Return the number of jobs waiting for their deadline."""
+        return sum(1 for _, _, entry in self._queue if not entry.cancelled)
+
+    @callback
+    def async_schedule(
+        self, name: str, job: AquariteJob, delay: float
+    ) -> CALLBACK_TYPE:
+        """Run a job after about ``delay`` seconds and return its cancel callback."""
+        entry = _ScheduledJob(name, job, delay)
+        self._async_push(entry, delay)
+
+        @callback
+        def _async_cancel() -> None:
+            entry.cancelled = True
+            if entry.task is not None:
+                entry.task.cancel()
+
+        return _async_cancel
+
+    @callback
+    def _async_push(self, entry: _ScheduledJob, delay: float) -> None:
+        """Queue a job at a jittered deadline."""
+        delay *= 1 - SCHEDULER_JITTER * random.random()
+        heapq.heappush(
+            self._queue,
+            (self._hass.loop.time() + delay, next(self._sequence), entry),
+        )
+        self._async_arm()
+
+    @callback
+    def _async_arm(self) -> None:
+        """Point the timer at the earliest deadline, or stop it."""
+        while self._queue and self._queue[0][2].cancelled:
+            heapq.heappop(self._queue)
+        deadline = self._queue[0][0] if self._queue else None
+        if deadline == self._timer_deadline:
+            return
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        self._timer_deadline = deadline
+        if deadline is not None:
+            self._cancel_timer = async_call_later(
+                self._hass,
+                max(deadline - self._hass.loop.time(), 0),
+                self._async_run_due,
+            )
+
+    @callback
+    def _async_run_due(self, *_: Any) -> None:
+        """Start every job whose deadline passed."""
+        self._cancel_timer = None
+        self._timer_deadline = None
+        now = self._hass.loop.time()
+        while self._queue and self._queue[0][0] <= now:
+            _, _, entry = heapq.heappop(self._queue)
+            if not entry.cancelled and not self._hass.is_stopping:
+                entry.task = self._hass.async_create_background_task(
+                    self._async_run(entry), entry.name
+                )
+        self._async_arm()
+
+    async def _async_run(self, entry: _ScheduledJob) -> None:
+        """Run a job and queue its next run.
+
+        A job that raises is not dropped: it runs again after its previous
+        delay, capped at SCHEDULER_RETRY_DELAY.
+        """
+        try:
+            delay = await entry.job()
+        except Exception:
+            _LOGGER.exception("Error running %s", entry.name)
+            delay = min(entry.delay, SCHEDULER_RETRY_DELAY)
+        finally:
+            entry.task = None
+        if delay is not None and not entry.cancelled:
+            entry.delay = delay
+            self._async_push(entry, delay)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> AquariteScheduler:
+    """Return the integration-wide scheduler, creating it if needed."""
+    scheduler: AquariteScheduler | None = hass.data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_SCHEDULER] = AquariteScheduler(hass)
+    return scheduler
@@ -7,13 +7,10 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AquariteConfigEntry
+from .const import PUMP_MODE_OPTIONS, PUMP_SPEED_OPTIONS, TIMER_SPEED_OPTIONS
 from .coordinator import AquariteDataUpdateCoordinator
 from .entity import AquariteEntity
 
-PUMP_MODE_OPTIONS: tuple[str, ...] = ("manual", "auto", "heat", "smart", "intel")
-PUMP_SPEED_OPTIONS: tuple[str, ...] = ("slow", "medium", "high")
-TIMER_SPEED_OPTIONS: tuple[str, ...] = ("slow", "medium", "high")
-
 PARALLEL_UPDATES = 1
 
 
@@ -75,7 +72,7 @@ class AquariteSelectEntity(AquariteEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
-        raw_value = self.coordinator.get_value(self._value_path)
+        raw_value = self.coordinator.get_display_value(self._value_path)
         try:
             return self._options_map[int(raw_value)]
         except (TypeError, ValueError, IndexError):
@@ -84,8 +81,8 @@ class AquariteSelectEntity(AquariteEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         """Select an option."""
         try:
-            await self.coordinator.api.set_value(
-                self._pool_id, self._value_path, self._options_map.index(option)
+            await self.coordinator.async_set_value(
+                self._value_path, self._options_map.index(option)
             )
         except Exception as err:
             raise HomeAssistantError(f"Failed to select option: {err}") from err
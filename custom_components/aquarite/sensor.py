@@ -1,6 +1,9 @@
 """Aquarite Sensor entities."""
 from __future__ import annotations
 
+from datetime import datetime, timedelta
+from typing import Any
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -11,12 +14,18 @@ from homeassistant.const import (
     EntityCategory,
     UnitOfElectricPotential,
     UnitOfTemperature,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 
 from . import AquariteConfigEntry
 from .const import (
+    CONNECTION_STATES,
+    LATENCY_STAGES,
+    LATENCY_UPDATE_INTERVAL,
     PATH_HASCD,
     PATH_HASCL,
     PATH_HASHIDRO,
@@ -133,6 +142,27 @@ async def async_setup_entry(
         AquaritePoolNameSensorEntity(dataservice, pool_id, pool_name)
     )
 
+    # Controller clock drift (diagnostic)
+    entities.append(
+        AquariteClockDriftSensorEntity(dataservice, pool_id, pool_name)
+    )
+
+    # Time since the cloud stream last delivered a snapshot (diagnostic)
+    entities.append(
+        AquariteLastSnapshotSensorEntity(dataservice, pool_id, pool_name)
+    )
+
+    # Cloud connection state machine (diagnostic)
+    entities.append(
+        AquariteConnectionStateSensorEntity(dataservice, pool_id, pool_name)
+    )
+
+    # Median snapshot latency per delivery stage (diagnostic, disabled by default)
+    entities.extend(
+        AquariteLatencySensorEntity(dataservice, pool_id, pool_name, stage)
+        for stage in LATENCY_STAGES
+    )
+
     async_add_entities(entities)
 
 
@@ -316,6 +346,11 @@ class AquariteLocationSensorEntity(AquariteEntity, SensorEntity):
         self._attr_translation_key = translation_key
         self._attr_unique_id = self.build_unique_id(name)
 
+    @property
+    def value_paths(self) -> frozenset[str]:
+        """Return the form path of this location field."""
+        return frozenset((f"form.{self._form_key}",))
+
     @property
     def native_value(self) -> str | None:
         """Return the location value."""
@@ -339,6 +374,11 @@ class AquaritePoolNameSensorEntity(AquariteEntity, SensorEntity):
         self._attr_translation_key = "pool_name"
         self._attr_unique_id = self.build_unique_id("name")
 
+    @property
+    def value_paths(self) -> frozenset[str]:
+        """Return no paths; the pool name comes from the config entry."""
+        return frozenset()
+
     @property
     def native_value(self) -> str:
         """Return the pool name."""
@@ -362,14 +402,185 @@ class AquariteRssiSensorEntity(AquariteEntity, SensorEntity):
     ) -> None:
         """Initialize the RSSI sensor."""
         super().__init__(dataservice, pool_id, pool_name)
+        self._value_path = "main.RSSI"
         self._attr_translation_key = "rssi"
         self._attr_unique_id = self.build_unique_id("RSSI")
 
     @property
     def native_value(self) -> int | None:
         """Return the RSSI value."""
-        value = self.coordinator.get_value("main.RSSI")
+        value = self.coordinator.get_value(self._value_path)
         try:
             return int(value)
         except (TypeError, ValueError):
             return None
+
+
+class AquariteClockDriftSensorEntity(AquariteEntity, SensorEntity):
+    """Controller clock drift relative to Home Assistant's local time."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        dataservice: AquariteDataUpdateCoordinator,
+        pool_id: str,
+        pool_name: str,
+    ) -> None:
+        """Initialize the clock drift sensor."""
+        super().__init__(dataservice, pool_id, pool_name)
+        self._value_path = "main.localTime"
+        self._attr_translation_key = "clock_drift"
+        self._attr_unique_id = self.build_unique_id("ClockDrift")
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the estimated drift in seconds, positive when fast."""
+        return self.coordinator.clock_drift
+
+
+class AquariteLastSnapshotSensorEntity(AquariteEntity, SensorEntity):
+    """When the cloud stream last delivered a snapshot.
+
+    A timestamp rather than an age, so the state only changes when a
+    snapshot arrives instead of on a timer.
+    """
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        dataservice: AquariteDataUpdateCoordinator,
+        pool_id: str,
+        pool_name: str,
+    ) -> None:
+        """Initialize the last snapshot sensor."""
+        super().__init__(dataservice, pool_id, pool_name)
+        self._attr_translation_key = "last_snapshot"
+        self._attr_unique_id = self.build_unique_id("LastSnapshot")
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return when the last snapshot arrived."""
+        return self.coordinator.last_snapshot_time
+
+
+class AquariteConnectionStateSensorEntity(AquariteEntity, SensorEntity):
+    """State of the pool's cloud connection, with transition counters."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = list(CONNECTION_STATES)
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        dataservice: AquariteDataUpdateCoordinator,
+        pool_id: str,
+        pool_name: str,
+    ) -> None:
+        """Initialize the connection state sensor."""
+        super().__init__(dataservice, pool_id, pool_name)
+        self._attr_translation_key = "connection_state"
+        self._attr_unique_id = self.build_unique_id("ConnectionState")
+
+    @property
+    def value_paths(self) -> frozenset[str]:
+        """Return no paths; the state changes without any snapshot."""
+        return frozenset()
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the coordinator's connection state changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self.coordinator.connection_signal,
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def native_value(self) -> str:
+        """Return the current connection state."""
+        return self.coordinator.connection_state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return when the state was entered and how often each was entered."""
+        return {
+            "since": self.coordinator.connection_since.isoformat(),
+            "transitions": dict(self.coordinator.connection_transitions),
+        }
+
+
+class AquariteLatencySensorEntity(AquariteEntity, SensorEntity):
+    """Median latency of one snapshot delivery stage.
+
+    Samples arrive with every snapshot, so the state is written on a
+    coarse timer, and only if new samples came in, rather than per update.
+    """
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_suggested_display_precision = 1
+
+    def __init__(
+        self,
+        dataservice: AquariteDataUpdateCoordinator,
+        pool_id: str,
+        pool_name: str,
+        stage: str,
+    ) -> None:
+        """Initialize the latency sensor."""
+        super().__init__(dataservice, pool_id, pool_name)
+        self._histogram = dataservice.latency[stage]
+        self._written_count = 0
+        self._attr_translation_key = f"{stage}_latency"
+        self._attr_unique_id = self.build_unique_id(f"{stage.capitalize()}Latency")
+
+    @property
+    def value_paths(self) -> frozenset[str]:
+        """Return no paths: snapshots never trigger a write."""
+        return frozenset()
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh on a timer instead of on every snapshot."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_tick,
+                timedelta(seconds=LATENCY_UPDATE_INTERVAL),
+            )
+        )
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Write the state if samples were recorded since the last write."""
+        if self._histogram.count != self._written_count:
+            self._written_count = self._histogram.count
+            self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the median latency in milliseconds."""
+        median = self._histogram.quantile(0.5)
+        return None if median is None else median * 1000
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the tail latencies and sample count."""
+        p90 = self._histogram.quantile(0.9)
+        p99 = self._histogram.quantile(0.99)
+        return {
+            "p90": None if p90 is None else p90 * 1000,
+            "p99": None if p99 is None else p99 * 1000,
+            "samples": self._histogram.count,
+        }
@@ -0,0 +1,307 @@
+"""Services for the Aquarite integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import datetime
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ATTR_SETTINGS,
+    DOMAIN,
+    FILTRATION_INTERVALS,
+    SERVICE_APPLY_SETTINGS,
+    SERVICE_SET_FILTRATION_SCHEDULE,
+    SERVICE_SYNC_POOL_TIME,
+    SYNC_TIME_CONCURRENCY,
+    SYNC_TIME_TIMEOUT,
+    TIMER_SPEED_OPTIONS,
+)
+from .coordinator import AquariteDataUpdateCoordinator, AquariteNotConfirmedError
+from .settings import convert_settings
+
+APPLY_SETTINGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_SETTINGS): vol.All(dict, vol.Length(min=1)),
+    }
+)
+
+SYNC_POOL_TIME_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SET_FILTRATION_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        **{
+            key: validator
+            for index in FILTRATION_INTERVALS
+            for key, validator in (
+                (vol.Optional(f"interval{index}_start"), cv.time),
+                (vol.Optional(f"interval{index}_end"), cv.time),
+                (vol.Optional(f"interval{index}_speed"), vol.In(TIMER_SPEED_OPTIONS)),
+            )
+        },
+    }
+)
+
+
+def _time_to_seconds(value: datetime.time) -> int:
+    """Return the controller representation of a time of day."""
+    return value.hour * 3600 + value.minute * 60
+
+
+def _seconds_to_time(seconds: Any) -> str:
+    """Return a controller time of day as HH:MM:SS."""
+    seconds = int(seconds)
+    return datetime.time((seconds // 3600) % 24, (seconds % 3600) // 60).isoformat()
+
+
+def build_filtration_schedule(
+    coordinator: AquariteDataUpdateCoordinator, data: dict[str, Any]
+) -> dict[str, Any]:
+    """Merge requested schedule fields over the current one and validate it.
+
+    Returns the path/value map to write.  Every interval must end at or
+    after its start (equal times leave it disabled) and enabled intervals
+    must not overlap.
+    """
+    values: dict[str, Any] = {}
+    windows: list[tuple[int, int, int]] = []
+    for index in FILTRATION_INTERVALS:
+        prefix = f"filtration.interval{index}"
+        start = data.get(f"interval{index}_start")
+        end = data.get(f"interval{index}_end")
+        try:
+            start_seconds = (
+                _time_to_seconds(start)
+                if start is not None
+                else int(coordinator.get_display_value(f"{prefix}.from"))
+            )
+            end_seconds = (
+                _time_to_seconds(end)
+                if end is not None
+                else int(coordinator.get_display_value(f"{prefix}.to"))
+            )
+        except (TypeError, ValueError) as err:
+            raise ServiceValidationError(
+                f"Filtration interval {index} is not known for this pool"
+            ) from err
+        if end_seconds < start_seconds:
+            raise ServiceValidationError(
+                f"Filtration interval {index} ends before it starts"
+            )
+        values[f"{prefix}.from"] = start_seconds
+        values[f"{prefix}.to"] = end_seconds
+        if (speed := data.get(f"interval{index}_speed")) is not None:
+            values[f"filtration.timerVel{index}"] = TIMER_SPEED_OPTIONS.index(speed)
+        if end_seconds > start_seconds:
+            windows.append((start_seconds, end_seconds, index))
+
+    windows.sort()
+    for (_, previous_end, previous), (start, _, index) in zip(windows, windows[1:]):
+        if start < previous_end:
+            raise ServiceValidationError(
+                f"Filtration intervals {previous} and {index} overlap"
+            )
+    return values
+
+
+def _filtration_schedule(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> dict[str, Any]:
+    """Return the schedule the pool reports."""
+    intervals = []
+    for index in FILTRATION_INTERVALS:
+        speed = coordinator.get_value(f"filtration.timerVel{index}")
+        try:
+            speed_option = TIMER_SPEED_OPTIONS[int(speed)]
+        except (TypeError, ValueError, IndexError):
+            speed_option = None
+        intervals.append(
+            {
+                "start": _seconds_to_time(
+                    coordinator.get_value(f"filtration.interval{index}.from")
+                ),
+                "end": _seconds_to_time(
+                    coordinator.get_value(f"filtration.interval{index}.to")
+                ),
+                "speed": speed_option,
+            }
+        )
+    return {"intervals": intervals}
+
+
+async def async_sync_pool_times(
+    coordinators: Iterable[AquariteDataUpdateCoordinator],
+) -> dict[str, dict[str, Any]]:
+    """Sync the clock of several pools concurrently.
+
+    At most SYNC_TIME_CONCURRENCY writes run at once and each pool gets
+    SYNC_TIME_TIMEOUT seconds, so one slow pool never holds up the rest.
+    Returns the outcome and latency of every pool keyed by entry id.
+    """
+    semaphore = asyncio.Semaphore(SYNC_TIME_CONCURRENCY)
+
+    async def _sync(coordinator: AquariteDataUpdateCoordinator) -> dict[str, Any]:
+        async with semaphore:
+            started = time.monotonic()
+            error: str | None = None
+            try:
+                async with asyncio.timeout(SYNC_TIME_TIMEOUT):
+                    await coordinator.set_pool_time_to_now()
+            except TimeoutError:
+                error = f"timed out after {SYNC_TIME_TIMEOUT}s"
+            except Exception as err:
+                error = str(err) or type(err).__name__
+            return {
+                "pool": coordinator.config_entry.title,
+                "success": error is None,
+                "latency_ms": round((time.monotonic() - started) * 1000),
+                "error": error,
+            }
+
+    coordinators = list(coordinators)
+    results = await asyncio.gather(
+        *(_sync(coordinator) for coordinator in coordinators)
+    )
+    return {
+        coordinator.config_entry.entry_id: result
+        for coordinator, result in zip(coordinators, results)
+    }
+
+
+@callback
+def _async_get_coordinator(
+    hass: HomeAssistant, entry_id: str
+) -> AquariteDataUpdateCoordinator:
+    """Return the coordinator of a loaded Aquarite entry."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(f"Unknown Aquarite entry {entry_id}")
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"Aquarite entry {entry.title} is not loaded")
+    return entry.runtime_data.coordinator
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Aquarite services once."""
+    if hass.services.has_service(DOMAIN, SERVICE_SYNC_POOL_TIME):
+        return
+
+    async def handle_sync_time(call: ServiceCall) -> ServiceResponse:
+        """Sync pool time for the targeted, or all loaded, entries."""
+        if ATTR_CONFIG_ENTRY_ID in call.data:
+            coordinators = [
+                _async_get_coordinator(hass, entry_id)
+                for entry_id in call.data[ATTR_CONFIG_ENTRY_ID]
+            ]
+        else:
+            coordinators = [
+                config_entry.runtime_data.coordinator
+                for config_entry in hass.config_entries.async_entries(DOMAIN)
+                if config_entry.state is ConfigEntryState.LOADED
+            ]
+        results = await async_sync_pool_times(coordinators)
+        if call.return_response:
+            return {"pools": results}
+        failed = [
+            f"{result['pool']}: {result['error']}"
+            for result in results.values()
+            if not result["success"]
+        ]
+        if failed:
+            raise HomeAssistantError(f"Failed to sync pool time: {'; '.join(failed)}")
+        return None
+
+    async def handle_set_filtration_schedule(call: ServiceCall) -> ServiceResponse:
+        """Validate a filtration schedule and write it, undone on failure."""
+        coordinator = _async_get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        values = build_filtration_schedule(coordinator, call.data)
+        try:
+            await coordinator.async_set_values(
+                values, confirm=call.return_response, rollback=True
+            )
+        except AquariteNotConfirmedError as err:
+            raise HomeAssistantError(
+                f"Filtration schedule written but not confirmed: {err}"
+            ) from err
+        except Exception as err:
+            raise HomeAssistantError(
+                f"Failed to set filtration schedule: {str(err) or type(err).__name__}"
+            ) from err
+        if not call.return_response:
+            return None
+        return _filtration_schedule(coordinator)
+
+    async def handle_apply_settings(call: ServiceCall) -> None:
+        """Validate settings for every targeted pool, then write them."""
+        batches = [
+            (coordinator, convert_settings(coordinator, call.data[ATTR_SETTINGS]))
+            for coordinator in (
+                _async_get_coordinator(hass, entry_id)
+                for entry_id in call.data[ATTR_CONFIG_ENTRY_ID]
+            )
+        ]
+        results = await asyncio.gather(
+            *(coordinator.async_set_values(values) for coordinator, values in batches),
+            return_exceptions=True,
+        )
+        failed = [
+            f"{coordinator.config_entry.title}: {result}"
+            for (coordinator, _), result in zip(batches, results)
+            if isinstance(result, Exception)
+        ]
+        if failed:
+            raise HomeAssistantError(f"Failed to apply settings: {'; '.join(failed)}")
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SYNC_POOL_TIME,
+        handle_sync_time,
+        schema=SYNC_POOL_TIME_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_FILTRATION_SCHEDULE,
+        handle_set_filtration_schedule,
+        schema=SET_FILTRATION_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_SETTINGS,
+        handle_apply_settings,
+        schema=APPLY_SETTINGS_SCHEMA,
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the Aquarite services."""
+    for service in (
+        SERVICE_SYNC_POOL_TIME,
+        SERVICE_SET_FILTRATION_SCHEDULE,
+        SERVICE_APPLY_SETTINGS,
+    ):
+        hass.services.async_remove(DOMAIN, service)
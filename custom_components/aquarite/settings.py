@@ -0,0 +1,157 @@
+"""Writable pool settings and their conversion to controller values."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.exceptions import ServiceValidationError
+
+from .const import (
+    NUMBER_SCALE_MAP,
+    PATH_HASHIDRO,
+    PATH_HASPH,
+    PATH_HASRX,
+    PUMP_MODE_OPTIONS,
+    PUMP_SPEED_OPTIONS,
+    TIMER_SPEED_OPTIONS,
+)
+from .coordinator import AquariteDataUpdateCoordinator
+
+
+@dataclass(frozen=True)
+class AquariteSetting:
+    """A writable value path and how user values map onto it.
+
+    Numbers are bounded by ``minimum``/``maximum`` (``maximum_path`` reads
+    a pool-specific bound in controller units) and scaled with
+    NUMBER_SCALE_MAP; the number entities take their range from here
+    too.  Selects map an option name to its index; switches take a
+    boolean.  ``requires`` names the capability flag the pool must report
+    for the setting to exist.
+    """
+
+    kind: str
+    minimum: float | None = None
+    maximum: float | None = None
+    maximum_path: str | None = None
+    options: tuple[str, ...] = ()
+    requires: str | None = None
+
+
+def _number(
+    minimum: float,
+    maximum: float,
+    requires: str | None = None,
+    maximum_path: str | None = None,
+) -> AquariteSetting:
+    """Return a bounded number setting."""
+    return AquariteSetting(
+        "number", minimum, maximum, maximum_path=maximum_path, requires=requires
+    )
+
+
+def _select(options: tuple[str, ...]) -> AquariteSetting:
+    """Return a select setting."""
+    return AquariteSetting("select", options=options)
+
+
+def _switch(requires: str | None = None) -> AquariteSetting:
+    """Return an on/off setting."""
+    return AquariteSetting("switch", requires=requires)
+
+
+SETTINGS: dict[str, AquariteSetting] = {
+    "modules.rx.status.value": _number(500, 800, PATH_HASRX),
+    "modules.ph.status.low_value": _number(6, 8, PATH_HASPH),
+    "modules.ph.status.high_value": _number(6, 8, PATH_HASPH),
+    "hidro.level": _number(0, 50, PATH_HASHIDRO, "hidro.maxAllowedValue"),
+    "filtration.intel.temp": _number(5, 40),
+    "filtration.heating.temp": _number(5, 40, "filtration.hasHeat"),
+    "filtration.heating.tempHi": _number(5, 40, "filtration.hasHeat"),
+    "filtration.smart.tempMin": _number(5, 40, "filtration.hasSmart"),
+    "filtration.smart.tempHigh": _number(5, 40, "filtration.hasSmart"),
+    "filtration.mode": _select(PUMP_MODE_OPTIONS),
+    "filtration.manVel": _select(PUMP_SPEED_OPTIONS),
+    "filtration.timerVel1": _select(TIMER_SPEED_OPTIONS),
+    "filtration.timerVel2": _select(TIMER_SPEED_OPTIONS),
+    "filtration.timerVel3": _select(TIMER_SPEED_OPTIONS),
+    "filtration.status": _switch(),
+    "filtration.heating.clima": _switch("filtration.hasHeat"),
+    "filtration.smart.freeze": _switch("filtration.hasSmart"),
+    "hidro.cover_enabled": _switch(PATH_HASHIDRO),
+    "hidro.cloration_enabled": _switch(PATH_HASHIDRO),
+    "relays.relay1.info.onoff": _switch(),
+    "relays.relay2.info.onoff": _switch(),
+    "relays.relay3.info.onoff": _switch(),
+    "relays.relay4.info.onoff": _switch(),
+    "light.status": _switch(),
+}
+
+
+def number_bounds(
+    coordinator: AquariteDataUpdateCoordinator, path: str
+) -> tuple[float, float]:
+    """Return the minimum and maximum of a number setting for a pool."""
+    setting = SETTINGS[path]
+    maximum = setting.maximum
+    if setting.maximum_path is not None:
+        try:
+            raw_max = int(coordinator.get_value(setting.maximum_path, 0))
+        except (TypeError, ValueError):
+            raw_max = 0
+        if raw_max:
+            scale = NUMBER_SCALE_MAP.get(path)
+            maximum = raw_max / scale if scale else raw_max
+    return setting.minimum, maximum
+
+
+def _convert(
+    coordinator: AquariteDataUpdateCoordinator,
+    path: str,
+    setting: AquariteSetting,
+    value: Any,
+) -> Any:
+    """Return the controller value of one setting."""
+    if setting.kind == "select":
+        if value not in setting.options:
+            raise ServiceValidationError(
+                f"{path} must be one of {', '.join(setting.options)}"
+            )
+        return setting.options.index(value)
+
+    if setting.kind == "switch":
+        if not isinstance(value, (bool, int)) or value not in (0, 1):
+            raise ServiceValidationError(f"{path} must be true or false")
+        return int(value)
+
+    try:
+        number = float(value)
+    except (TypeError, ValueError) as err:
+        raise ServiceValidationError(f"{path} must be a number") from err
+    minimum, maximum = number_bounds(coordinator, path)
+    if not minimum <= number <= maximum:
+        raise ServiceValidationError(
+            f"{path} must be between {minimum:g} and {maximum:g}"
+        )
+    scale = NUMBER_SCALE_MAP.get(path)
+    return round(number * scale) if scale else number
+
+
+def convert_settings(
+    coordinator: AquariteDataUpdateCoordinator, values: Mapping[str, Any]
+) -> dict[str, Any]:
+    """Validate user values for a pool and return the raw values to write.
+
+    Raises ServiceValidationError naming the first unknown, unsupported or
+    out-of-range setting; nothing is written unless every value passes.
+    """
+    raw_values: dict[str, Any] = {}
+    for path, value in values.items():
+        setting = SETTINGS.get(path)
+        if setting is None:
+            raise ServiceValidationError(f"{path} is not a writable setting")
+        if setting.requires and not coordinator.get_value(setting.requires):
+            raise ServiceValidationError(f"{path} is not supported by this pool")
+        raw_values[path] = _convert(coordinator, path, setting, value)
+    return raw_values
@@ -0,0 +1,143 @@
+"""Snapshot helpers for the Aquarite coordinator."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import re
+from typing import Any
+
+from .const import NUMERIC_PATHS
+
+_INT_RE = re.compile(r"-?(?:0|[1-9]\d*)")
+_FLOAT_RE = re.compile(r"-?(?:0|[1-9]\d*)\.\d+")
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    """Dotted paths that differ between two pool documents.
+
+    ``changed`` holds leaves present in both documents whose value differs,
+    ``added`` and ``removed`` hold the roots of subtrees that only exist in
+    the new or the old document respectively.
+    """
+
+    changed: frozenset[str] = frozenset()
+    added: frozenset[str] = frozenset()
+    removed: frozenset[str] = frozenset()
+
+    def __bool__(self) -> bool:
+        """Return true if anything differs."""
+        return bool(self.changed or self.added or self.removed)
+
+    @property
+    def paths(self) -> frozenset[str]:
+        """Return every changed, added and removed path."""
+        return self.changed | self.added | self.removed
+
+    def as_dict(self) -> dict[str, list[str]]:
+        """Return a JSON-friendly representation for diagnostics."""
+        return {
+            "changed": sorted(self.changed),
+            "added": sorted(self.added),
+            "removed": sorted(self.removed),
+        }
+
+
+def _diff_into(
+    old: dict[str, Any],
+    new: dict[str, Any],
+    prefix: str,
+    changed: set[str],
+    added: set[str],
+    removed: set[str],
+) -> None:
+    """Collect differing paths of two dicts, skipping identical subtrees."""
+    for key, new_value in new.items():
+        path = f"{prefix}{key}"
+        if key not in old:
+            added.add(path)
+            continue
+        old_value = old[key]
+        if old_value is new_value or old_value == new_value:
+            continue
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            _diff_into(old_value, new_value, f"{path}.", changed, added, removed)
+        else:
+            changed.add(path)
+    for key in old.keys() - new.keys():
+        removed.add(f"{prefix}{key}")
+
+
+def diff_snapshots(old: dict[str, Any] | None, new: dict[str, Any]) -> SnapshotDiff:
+    """Return the structural difference between two pool documents.
+
+    Equal subtrees are skipped with a single comparison, so the walk only
+    descends into the branches that actually changed.
+    """
+    if old is None:
+        return SnapshotDiff(added=frozenset(new))
+    if old is new or old == new:
+        return SnapshotDiff()
+    changed: set[str] = set()
+    added: set[str] = set()
+    removed: set[str] = set()
+    _diff_into(old, new, "", changed, added, removed)
+    return SnapshotDiff(frozenset(changed), frozenset(added), frozenset(removed))
+
+
+def fingerprint(data: dict[str, Any]) -> bytes:
+    """Return a content fingerprint of a pool document.
+
+    The document is encoded canonically (sorted keys, compact separators)
+    so two deliveries of the same content always hash alike.
+    """
+    encoded = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+# Key tree {key: subtree} of NUMERIC_PATHS; an empty subtree marks a leaf.
+_NumericTree = dict[str, "_NumericTree"]
+
+
+def _numeric_tree(paths: frozenset[str]) -> _NumericTree:
+    """Return the key tree of dotted paths."""
+    tree: _NumericTree = {}
+    for path in paths:
+        node = tree
+        for key in path.split("."):
+            node = node.setdefault(key, {})
+    return tree
+
+
+_NUMERIC_TREE = _numeric_tree(NUMERIC_PATHS)
+
+
+def _coerce(value: Any, tree: _NumericTree) -> Any:
+    """Convert numeric strings at the leaves of ``tree`` to numbers."""
+    if not tree:
+        if isinstance(value, str):
+            if _INT_RE.fullmatch(value):
+                return int(value)
+            if _FLOAT_RE.fullmatch(value):
+                return float(value)
+        return value
+    if not isinstance(value, dict):
+        return value
+    return {
+        key: _coerce(item, tree[key]) if key in tree else item
+        for key, item in value.items()
+    }
+
+
+def normalize(data: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a pool document with numeric strings coerced.
+
+    Only the fields in NUMERIC_PATHS are touched; everything else, such as
+    ``form`` or the firmware version, keeps its strings.  Values with
+    leading zeros are left alone so they round-trip unchanged.  Dicts off
+    those paths are shared with the input rather than copied.
+    """
+    return _coerce(data, _NUMERIC_TREE)
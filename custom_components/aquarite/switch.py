@@ -93,30 +93,38 @@ class AquariteSwitchEntity(AquariteEntity, SwitchEntity):
         """Initialize the switch."""
         super().__init__(coordinator, pool_id, pool_name)
         self._value_path = config.value_path
-        self._is_relay = config.is_relay
         self._attr_translation_key = config.translation_key
         self._attr_unique_id = self.build_unique_id(config.name)
+        self._status_path = (
+            config.value_path.replace("onoff", "status") if config.is_relay else None
+        )
+
+    @property
+    def value_paths(self) -> frozenset[str]:
+        """Return the onoff path plus the relay status path when relevant."""
+        if self._status_path:
+            return frozenset((self._value_path, self._status_path))
+        return frozenset((self._value_path,))
 
     @property
     def is_on(self) -> bool:
         """Return true if switch is on."""
-        onoff = bool(self.coordinator.get_value(self._value_path))
-        if self._is_relay:
-            status_path = self._value_path.replace("onoff", "status")
-            status = bool(self.coordinator.get_value(status_path))
+        onoff = bool(self.coordinator.get_display_value(self._value_path))
+        if self._status_path:
+            status = bool(self.coordinator.get_value(self._status_path))
             return onoff or status
         return onoff
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         try:
-            await self.coordinator.api.set_value(self._pool_id, self._value_path, 1)
+            await self.coordinator.async_set_value(self._value_path, 1)
         except Exception as err:
             raise HomeAssistantError(f"Failed to turn on: {err}") from err
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         try:
-            await self.coordinator.api.set_value(self._pool_id, self._value_path, 0)
+            await self.coordinator.async_set_value(self._value_path, 0)
         except Exception as err:
             raise HomeAssistantError(f"Failed to turn off: {err}") from err
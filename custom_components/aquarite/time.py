@@ -64,7 +64,7 @@ class AquariteTimeEntity(AquariteEntity, TimeEntity):
     @property
     def native_value(self) -> datetime.time | None:
         """Return the interval time as a time object."""
-        raw_value = self.coordinator.get_value(self._value_path)
+        raw_value = self.coordinator.get_display_value(self._value_path)
         try:
             seconds = int(raw_value)
             hours = (seconds // 3600) % 24
@@ -77,8 +77,6 @@ class AquariteTimeEntity(AquariteEntity, TimeEntity):
         """Set the interval time."""
         seconds = value.hour * 3600 + value.minute * 60
         try:
-            await self.coordinator.api.set_value(
-                self._pool_id, self._value_path, seconds,
-            )
+            await self.coordinator.async_set_value(self._value_path, seconds)
         except Exception as err:
             raise HomeAssistantError(f"Failed to set time: {err}") from err
@@ -0,0 +1,188 @@
+"""Tests for the shared Aquarite account connection.
+
+These tests require the Home Assistant test framework (pytest-homeassistant-custom-component).
+Run with: pytest tests/test_account.py (requires HA test environment)
+"""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+
+from .conftest import MOCK_PASSWORD, MOCK_USERNAME
+
+# Skip the entire module if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.aquarite.account import (  # noqa: E402
+    async_acquire_account,
+    async_release_account,
+)
+from custom_components.aquarite.const import (  # noqa: E402
+    TOKEN_RETRY_DELAY,
+    WATCHDOG_INTERVAL,
+)
+
+PATCH_AUTH = "custom_components.aquarite.account.AquariteAuth"
+PATCH_CLIENT = "custom_components.aquarite.account.AquariteClient"
+
+
+@pytest.fixture(autouse=True)
+def mock_library():
+    """Patch the library so accounts never reach the cloud."""
+    with patch(PATCH_AUTH) as mock_auth_cls, patch(PATCH_CLIENT):
+        mock_auth = mock_auth_cls.return_value
+        mock_auth.authenticate = AsyncMock()
+        mock_auth.get_client = AsyncMock(return_value=(MagicMock(), True))
+        mock_auth.is_token_expiring = MagicMock(return_value=True)
+        mock_auth.calculate_sleep_duration = MagicMock(return_value=3600)
+        yield mock_auth_cls
+
+
+async def test_entries_share_account(hass, mock_library) -> None:
+    """Test entries with the same credentials share one session."""
+    first = async_acquire_account(hass, MOCK_USERNAME, MOCK_PASSWORD)
+    second = async_acquire_account(hass, MOCK_USERNAME, MOCK_PASSWORD)
+    other = async_acquire_account(hass, "other@example.com", MOCK_PASSWORD)
+
+    assert first is second
+    assert first is not other
+    assert mock_library.call_count == 2
+
+    await first.async_authenticate()
+    await second.async_authenticate()
+    first.auth.authenticate.assert_awaited_once()
+
+    await async_release_account(hass, first)
+    assert first._unschedule
+    await async_release_account(hass, second)
+    assert not first._unschedule
+    await async_release_account(hass, other)
+
+
+async def test_token_refresh_resubscribes_account_watches(hass) -> None:
+    """Test a token refresh rebuilds the watches of every pool."""
+    account = async_acquire_account(hass, MOCK_USERNAME, MOCK_PASSWORD)
+    account.watches.async_resubscribe = AsyncMock()
+
+    await account.async_authenticate()
+    assert await account._async_refresh_token() == 3600
+
+    account.watches.async_resubscribe.assert_awaited_once()
+    await async_release_account(hass, account)
+
+
+async def test_failed_token_refresh_opens_breaker(hass) -> None:
+    """Test a failed refresh is retried soon, behind the account breaker."""
+    account = async_acquire_account(hass, MOCK_USERNAME, MOCK_PASSWORD)
+    account.auth.get_client = AsyncMock(side_effect=OSError("offline"))
+
+    assert await account._async_refresh_token() == TOKEN_RETRY_DELAY
+    assert account.breaker.as_dict()["state"] == "open"
+    assert account.breaker.as_dict()["last_error"] == "offline"
+    await async_release_account(hass, account)
+
+
+async def test_watchdog_resubscribes_stale_pools(hass) -> None:
+    """Test only a silent pool's watch is rebuilt, without token calls."""
+    account = async_acquire_account(hass, MOCK_USERNAME, MOCK_PASSWORD)
+    account.watches._callbacks = {"pool-a": MagicMock(), "pool-b": MagicMock()}
+    account.watches.async_resubscribe = AsyncMock()
+    fresh, silent = MagicMock(), MagicMock()
+    fresh.pool_id, silent.pool_id = "pool-a", "pool-b"
+    fresh.is_stale.return_value = False
+    silent.is_stale.return_value = True
+    fresh.connection_state = silent.connection_state = "live"
+    fresh.refresh_subscription = AsyncMock()
+    silent.refresh_subscription = AsyncMock()
+    account.attach(fresh)
+
+    assert account.stale_pools(100.0) == []
+    account.attach(silent)
+    assert account.stale_pools(100.0) == ["pool-b"]
+
+    assert await account._async_check_staleness() == WATCHDOG_INTERVAL
+
+    silent.refresh_subscription.assert_awaited_once()
+    fresh.refresh_subscription.assert_not_awaited()
+    account.watches.async_resubscribe.assert_not_awaited()
+    account.auth.get_client.assert_not_called()
+    # The silent pool stays stale until its new watch delivers
+    assert silent.async_set_connection_state.call_args_list == [call("stale")]
+    fresh.async_set_connection_state.assert_not_called()
+    await async_release_account(hass, account)
+
+
+async def test_registry_routes_library_watches_by_pool(hass) -> None:
+    """Test each pool is watched through the library and routed by id."""
+    account = async_acquire_account(hass, MOCK_USERNAME, MOCK_PASSWORD)
+    watch = MagicMock()
+    account.api.subscribe_pool = AsyncMock(return_value=watch)
+
+    pool_a, pool_b = MagicMock(), MagicMock()
+    await account.watches.async_attach("pool-a", pool_a)
+    await account.watches.async_attach("pool-b", pool_b)
+    assert account.watches.pool_ids == {"pool-a", "pool-b"}
+    assert account.api.subscribe_pool.await_count == 2
+    routers = {
+        call.args[0]: call.args[1]
+        for call in account.api.subscribe_pool.await_args_list
+    }
+
+    routers["pool-b"]({"main": {"temperature": 25}})
+    pool_a.assert_not_called()
+    pool_b.assert_called_once_with({"main": {"temperature": 25}})
+
+    await account.watches.async_resubscribe(["pool-a"])
+    assert account.api.subscribe_pool.await_args.args[0] == "pool-a"
+    assert watch.unsubscribe.call_count == 1
+
+    await account.watches.async_detach("pool-a")
+    await account.watches.async_detach("pool-b")
+    assert watch.unsubscribe.call_count == 3
+    await async_release_account(hass, account)
+
+
+async def test_registry_rebuild_is_make_before_break(hass) -> None:
+    """Test a resubscribe starts the new watch before stopping the old one."""
+    account = async_acquire_account(hass, MOCK_USERNAME, MOCK_PASSWORD)
+    events: list[str] = []
+    old_watch, new_watch = MagicMock(), MagicMock()
+    old_watch.unsubscribe.side_effect = lambda: events.append("unsubscribe old")
+
+    async def subscribe_pool(pool_id, callback):
+        events.append("subscribe")
+        return old_watch if len(events) == 1 else new_watch
+
+    account.api.subscribe_pool = subscribe_pool
+    await account.watches.async_attach("pool-a", MagicMock())
+    await account.watches.async_resubscribe()
+
+    assert events == ["subscribe", "subscribe", "unsubscribe old"]
+    await async_release_account(hass, account)
+
+
+async def test_registry_drops_deliveries_of_replaced_watch(hass) -> None:
+    """Test once a newer watch delivered, the older one's documents are dropped."""
+    account = async_acquire_account(hass, MOCK_USERNAME, MOCK_PASSWORD)
+    routers = []
+
+    async def subscribe_pool(pool_id, callback):
+        routers.append(callback)
+        return MagicMock()
+
+    account.api.subscribe_pool = subscribe_pool
+    on_data = MagicMock()
+    await account.watches.async_attach("pool-a", on_data)
+    await account.watches.async_resubscribe()
+    old, new = routers
+
+    old({"main": {"temperature": 25.0}})
+    new({"main": {"temperature": 26.0}})
+    old({"main": {"temperature": 25.5}})
+
+    assert [call.args[0] for call in on_data.call_args_list] == [
+        {"main": {"temperature": 25.0}},
+        {"main": {"temperature": 26.0}},
+    ]
+    await async_release_account(hass, account)
@@ -0,0 +1,72 @@
+"""Tests for the Aquarite account circuit breaker.
+
+These tests require the Home Assistant test framework (pytest-homeassistant-custom-component).
+Run with: pytest tests/test_breaker.py (requires HA test environment)
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+# Skip the entire module if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.aquarite.breaker import AquariteCircuitBreaker  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def short_delays() -> Generator[None]:
+    """Shrink the breaker delays and take the jitter out."""
+    with (
+        patch("custom_components.aquarite.breaker.BREAKER_BASE_DELAY", 0.1),
+        patch("custom_components.aquarite.breaker.BREAKER_RECOVERY_STAGGER", 0.05),
+        patch("custom_components.aquarite.breaker.random.random", return_value=1.0),
+    ):
+        yield
+
+
+async def _fail(breaker: AquariteCircuitBreaker) -> None:
+    """Run a failing call through the breaker."""
+    with pytest.raises(OSError):
+        async with breaker.async_attempt():
+            raise OSError("offline")
+
+
+async def test_recovery_probes_once_then_staggers(hass) -> None:
+    """Test one probe goes out after the hold and waiters follow it one by one."""
+    breaker = AquariteCircuitBreaker(hass, "test")
+    await _fail(breaker)
+    assert breaker.state == "open"
+    started: list[tuple[int, float]] = []
+
+    async def call(index: int) -> None:
+        async with breaker.async_attempt():
+            started.append((index, hass.loop.time()))
+            await asyncio.sleep(0.01)
+
+    opened = hass.loop.time()
+    await asyncio.gather(*(call(index) for index in range(3)))
+
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+    # The probe only left once the hold expired, alone
+    assert started[0][1] - opened >= 0.1
+    assert started[1][1] - started[0][1] >= 0.01
+    # Released waiters are spread out instead of rushing together
+    assert started[2][1] - started[1][1] >= 0.05
+
+
+async def test_failed_probe_holds_longer(hass) -> None:
+    """Test a failed probe reopens the breaker for a doubled delay."""
+    breaker = AquariteCircuitBreaker(hass, "test")
+    await _fail(breaker)
+    first_hold = breaker.as_dict()["retry_in"]
+
+    await _fail(breaker)
+
+    assert breaker.failures == 2
+    assert breaker.as_dict()["retry_in"] > first_hold
+    assert breaker.as_dict()["opened_at"] is not None
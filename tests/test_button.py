@@ -0,0 +1,87 @@
+"""Tests for the Aquarite LED pulse button."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from .conftest import MOCK_POOL_ID
+
+# Skip the entire module if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from homeassistant.exceptions import HomeAssistantError  # noqa: E402
+
+from custom_components.aquarite.button import AquariteLEDPulseButtonEntity  # noqa: E402
+
+
+@pytest.fixture
+def button(hass) -> AquariteLEDPulseButtonEntity:
+    """Create an LED pulse button on a coordinator whose light is on."""
+    state = {"light.status": 1}
+
+    async def set_and_confirm(path: str, value: int) -> None:
+        await asyncio.sleep(0.01)
+        state[path] = value
+
+    coordinator = MagicMock()
+    coordinator.get_value = MagicMock(
+        side_effect=lambda path, default=None: state.get(path, default)
+    )
+    coordinator.set_and_confirm = AsyncMock(side_effect=set_and_confirm)
+
+    entity = AquariteLEDPulseButtonEntity(coordinator, MOCK_POOL_ID, "Pool")
+    entity.hass = hass
+    return entity
+
+
+async def test_advance_pulses_once_per_step(
+    button: AquariteLEDPulseButtonEntity,
+) -> None:
+    """Test each step turns the light off and back on after confirmation."""
+    await button.async_advance(2)
+
+    calls = button.coordinator.set_and_confirm.await_args_list
+    assert [call.args for call in calls] == [
+        ("light.status", 0),
+        ("light.status", 1),
+        ("light.status", 0),
+        ("light.status", 1),
+    ]
+
+
+async def test_presses_coalesce_into_one_sequence(
+    button: AquariteLEDPulseButtonEntity,
+) -> None:
+    """Test presses during a running sequence extend it instead of queuing."""
+    first = asyncio.ensure_future(button.async_advance(1))
+    await asyncio.sleep(0)
+    sequence = button._sequence
+
+    await asyncio.gather(first, button.async_press(), button.async_press())
+
+    assert button._sequence is sequence
+    assert button.coordinator.set_and_confirm.await_count == 6
+
+
+async def test_failed_pulse_fails_every_caller(
+    button: AquariteLEDPulseButtonEntity,
+) -> None:
+    """Test a failing pulse reaches the callers whose steps were queued."""
+
+    async def set_and_confirm(path: str, value: int) -> None:
+        await asyncio.sleep(0.01)
+        raise TimeoutError("no snapshot")
+
+    button.coordinator.set_and_confirm.side_effect = set_and_confirm
+
+    first = asyncio.ensure_future(button.async_advance(1))
+    await asyncio.sleep(0)
+    results = await asyncio.gather(
+        first, button.async_advance(3), return_exceptions=True
+    )
+
+    assert all(isinstance(result, HomeAssistantError) for result in results)
+    assert button.coordinator.set_and_confirm.await_count == 1
+    assert button._steps_pending == 0
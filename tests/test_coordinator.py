@@ -5,6 +5,8 @@ Run with: pytest tests/test_coordinator.py (requires HA test environment)
 """
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncGenerator
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -15,14 +17,20 @@ from .conftest import MOCK_POOL_ID
 # Skip the entire module if Home Assistant is not installed
 pytest.importorskip("homeassistant")
 
-from custom_components.aquarite.coordinator import AquariteDataUpdateCoordinator  # noqa: E402
+from aioaquarite import AuthenticationError  # noqa: E402
+from custom_components.aquarite.breaker import AquariteCircuitBreaker  # noqa: E402
+from custom_components.aquarite.const import CONF_COALESCE_WINDOW  # noqa: E402
+from custom_components.aquarite.coordinator import (  # noqa: E402
+    AquariteDataUpdateCoordinator,
+    AquariteNotConfirmedError,
+)
 
 
 @pytest.fixture
-def coordinator(
+async def coordinator(
     hass,
     mock_pool_data,
-) -> AquariteDataUpdateCoordinator:
+) -> AsyncGenerator[AquariteDataUpdateCoordinator]:
     """Create a coordinator with mock dependencies."""
     mock_auth = AsyncMock()
     mock_auth.is_token_expiring = MagicMock(return_value=False)
@@ -30,57 +38,51 @@ def coordinator(
     mock_auth.get_client = AsyncMock(return_value=(MagicMock(), False))
 
     mock_api = AsyncMock()
-    mock_api.subscribe_pool = AsyncMock(return_value=MagicMock())
     mock_api.set_value = AsyncMock()
 
+    mock_account = MagicMock()
+    mock_account.auth = mock_auth
+    mock_account.api = mock_api
+    mock_account.watches = AsyncMock()
+    mock_account.breaker = AquariteCircuitBreaker(hass, "test")
+    mock_account.async_authenticate = AsyncMock()
+
     mock_entry = MagicMock()
     mock_entry.entry_id = "test"
     mock_entry.options = {}
 
     coord = AquariteDataUpdateCoordinator(
-        hass, mock_entry, mock_auth, mock_api, MOCK_POOL_ID
+        hass, mock_entry, mock_account, MOCK_POOL_ID
     )
     coord.data = mock_pool_data
-    return coord
+    yield coord
+    await coord.async_shutdown()
 
 
 async def test_subscribe(coordinator: AquariteDataUpdateCoordinator) -> None:
-    """Test subscribe calls the API."""
+    """Test subscribe attaches the pool to the account watch registry."""
     await coordinator.subscribe()
-    coordinator.api.subscribe_pool.assert_called_once()
+    coordinator.account.watches.async_attach.assert_awaited_once_with(
+        MOCK_POOL_ID, coordinator._on_data
+    )
 
 
 async def test_refresh_subscription(
     coordinator: AquariteDataUpdateCoordinator,
 ) -> None:
-    """Test refresh_subscription unsubscribes and resubscribes."""
-    mock_watch = MagicMock()
-    coordinator.watch = mock_watch
-
-    with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_to_thread:
-        await coordinator.refresh_subscription()
-
-    mock_to_thread.assert_called_once_with(mock_watch.unsubscribe)
-    coordinator.api.subscribe_pool.assert_called_once()
+    """Test refresh_subscription rebuilds only this pool's watch."""
+    await coordinator.refresh_subscription()
+    coordinator.account.watches.async_resubscribe.assert_awaited_once_with(
+        (MOCK_POOL_ID,)
+    )
 
 
 async def test_async_shutdown(
     coordinator: AquariteDataUpdateCoordinator,
 ) -> None:
-    """Test shutdown cancels tasks and unsubscribes."""
-    mock_watch = MagicMock()
-    coordinator.watch = mock_watch
-
-    mock_health_task = AsyncMock()
-    mock_token_task = AsyncMock()
-    coordinator._health_task = mock_health_task
-    coordinator._token_task = mock_token_task
-
-    with patch("asyncio.to_thread", new_callable=AsyncMock):
-        await coordinator.async_shutdown()
-
-    mock_health_task.cancel.assert_called_once()
-    mock_token_task.cancel.assert_called_once()
+    """Test shutdown detaches the pool from the account watch registry."""
+    await coordinator.async_shutdown()
+    coordinator.account.watches.async_detach.assert_awaited_with(MOCK_POOL_ID)
 
 
 async def test_set_pool_time_to_now(
@@ -102,3 +104,623 @@ async def test_set_pool_time_to_now(
     utc_timestamp = int(fake_now.timestamp())
     expected = utc_timestamp + 7200
     assert call_args[0][2] == expected
+    assert not coordinator.targets
+
+
+async def test_cancelled_write_drops_target(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test a write cancelled by a caller's timeout leaves no target behind."""
+    gate = asyncio.Event()
+
+    async def set_value(pool_id: str, path: str, value: int) -> None:
+        await gate.wait()
+
+    coordinator.api.set_value.side_effect = set_value
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.05):
+            await coordinator.async_set_value("light.status", 1)
+
+    assert not coordinator.targets
+    gate.set()
+
+
+async def test_writes_are_batched(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test writes issued together are sent as one batch, newest value wins."""
+    await asyncio.gather(
+        coordinator.async_set_value("filtration.mode", 4),
+        coordinator.async_set_value("filtration.timerVel1", 2),
+        coordinator.async_set_value("filtration.mode", 3),
+    )
+
+    assert sorted(
+        call.args for call in coordinator.api.set_value.await_args_list
+    ) == [
+        (MOCK_POOL_ID, "filtration.mode", 3),
+        (MOCK_POOL_ID, "filtration.timerVel1", 2),
+    ]
+
+
+async def test_batched_write_failure_is_per_caller(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test a failing path only fails the callers that wrote it."""
+
+    async def set_value(pool_id: str, path: str, value: int) -> None:
+        if path == "relays.relay1.info.onoff":
+            raise RuntimeError("rejected")
+
+    coordinator.api.set_value.side_effect = set_value
+    results = await asyncio.gather(
+        coordinator.async_set_value("relays.relay1.info.onoff", 1),
+        coordinator.async_set_value("light.status", 1),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] is True
+
+
+async def test_write_equal_to_snapshot_is_skipped(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test writing the value the pool already reports sends nothing."""
+    await coordinator.async_set_value("filtration.mode", 1)
+
+    coordinator.api.set_value.assert_not_awaited()
+
+
+async def test_write_back_before_confirmation_is_sent(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test A->B->A is not skipped while B is sent but unconfirmed."""
+    await coordinator.async_set_value("light.status", 1)
+    await coordinator.async_set_value("light.status", 0)
+
+    assert [call.args[2] for call in coordinator.api.set_value.await_args_list] == [
+        1,
+        0,
+    ]
+    assert coordinator.get_display_value("light.status") == 0
+    assert coordinator.targets.as_dict() == {"light.status": 0}
+
+
+async def test_writes_to_one_path_never_reorder(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test a slider burst sends the first and the newest value, in order."""
+    release = asyncio.Event()
+    sent: list[int] = []
+
+    async def set_value(pool_id: str, path: str, value: int) -> None:
+        sent.append(value)
+        await release.wait()
+
+    coordinator.api.set_value.side_effect = set_value
+    first = asyncio.ensure_future(
+        coordinator.async_set_value("modules.rx.status.value", 650)
+    )
+    while not sent:
+        await asyncio.sleep(0.01)
+    burst = [
+        asyncio.ensure_future(
+            coordinator.async_set_value("modules.rx.status.value", value)
+        )
+        for value in (660, 670, 680)
+    ]
+    await asyncio.sleep(0.2)
+    assert sent == [650]
+
+    release.set()
+    await asyncio.gather(first, *burst)
+    assert sent == [650, 680]
+
+
+async def test_written_value_is_shown_until_confirmed(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test a write is shown at once and dropped when a snapshot reports it."""
+    release = asyncio.Event()
+
+    async def set_value(pool_id: str, path: str, value: int) -> None:
+        await release.wait()
+
+    coordinator.api.set_value.side_effect = set_value
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, frozenset({"light.status"}))
+
+    write = asyncio.ensure_future(coordinator.async_set_value("light.status", 1))
+    await asyncio.sleep(0)
+    assert coordinator.get_display_value("light.status") == 1
+    assert coordinator.get_value("light.status") == 0
+    listener.assert_called_once()
+
+    release.set()
+    await write
+    assert coordinator.targets.as_dict() == {"light.status": 1}
+
+    coordinator.async_set_updated_data({**mock_pool_data, "light": {"status": 1}})
+    assert not coordinator.targets
+
+
+async def test_written_value_is_not_reported(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test a read-only path keeps the reported value while a write is pending."""
+    await coordinator.async_set_value("filtration.status", 0)
+
+    assert coordinator.get_display_value("filtration.status") == 0
+    assert coordinator.get_value("filtration.status") == 1
+
+
+async def test_failed_write_reverts_shown_value(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test a failed write drops its target and notifies listeners again."""
+    coordinator.api.set_value.side_effect = RuntimeError("rejected")
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, frozenset({"light.status"}))
+
+    with pytest.raises(RuntimeError):
+        await coordinator.async_set_value("light.status", 1)
+
+    assert coordinator.get_display_value("light.status") == 0
+    assert listener.call_count == 2
+
+
+async def test_unconfirmed_write_expires_on_timer(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test an unconfirmed target is reverted and pushed once on expiry."""
+    coordinator.targets._timeout = 0.3
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, frozenset({"light.status"}))
+
+    await coordinator.async_set_value("light.status", 1)
+    assert coordinator.get_display_value("light.status") == 1
+    listener.reset_mock()
+
+    await asyncio.sleep(0.3)
+    assert coordinator.get_display_value("light.status") == 0
+    listener.assert_called_once()
+
+
+async def test_set_and_confirm_waits_for_snapshot(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test set_and_confirm returns once a snapshot reports the value."""
+    confirm = asyncio.ensure_future(
+        coordinator.set_and_confirm("light.status", 1, timeout=5)
+    )
+    await asyncio.sleep(0.2)
+    coordinator.api.set_value.assert_awaited_once_with(
+        MOCK_POOL_ID, "light.status", 1
+    )
+    assert not confirm.done()
+
+    coordinator.async_set_updated_data({**mock_pool_data, "light": {"status": 1}})
+    await confirm
+    assert not coordinator._confirm_waiters
+
+
+async def test_set_and_confirm_times_out(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test set_and_confirm raises when no snapshot confirms the value."""
+    with pytest.raises(TimeoutError):
+        await coordinator.set_and_confirm("light.status", 1, timeout=0.05)
+    assert not coordinator._confirm_waiters
+
+
+async def test_set_values_writes_one_batch(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test several values are queued together and failures surface."""
+    await coordinator.async_set_values(
+        {"filtration.interval1.from": 30600, "filtration.timerVel1": 2}
+    )
+    assert coordinator.api.set_value.await_count == 2
+
+    coordinator.api.set_value.side_effect = RuntimeError("rejected")
+    with pytest.raises(RuntimeError):
+        await coordinator.async_set_values({"filtration.timerVel2": 2})
+
+
+async def test_set_values_rolls_back_partial_failure(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test fields written before a failure are restored with rollback."""
+
+    async def set_value(pool_id: str, path: str, value: int) -> None:
+        if path == "filtration.timerVel1":
+            raise RuntimeError("rejected")
+
+    coordinator.api.set_value.side_effect = set_value
+    with pytest.raises(RuntimeError):
+        await coordinator.async_set_values(
+            {"filtration.interval1.from": 30600, "filtration.timerVel1": 2},
+            rollback=True,
+        )
+
+    writes = [args[1:] for args, _ in coordinator.api.set_value.await_args_list]
+    assert writes[-2:] == [
+        ("filtration.interval1.from", 28800),
+        ("filtration.timerVel1", 1),
+    ]
+
+
+async def test_set_values_keeps_unconfirmed_writes(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test a slow confirmation is reported, not rolled back."""
+    with (
+        patch("custom_components.aquarite.coordinator.CONFIRM_TIMEOUT", 0.05),
+        pytest.raises(AquariteNotConfirmedError, match="filtration.timerVel1"),
+    ):
+        await coordinator.async_set_values(
+            {"filtration.timerVel1": 2}, confirm=True, rollback=True
+        )
+
+    assert coordinator.api.set_value.await_count == 1
+
+
+async def test_clock_drift_triggers_rate_limited_sync(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test sustained drift past the threshold schedules one clock sync."""
+    coordinator.async_set_updated_data(mock_pool_data)
+    tz = timezone(timedelta(hours=2))
+    now = datetime(2026, 4, 12, 14, 30, 0, tzinfo=tz)
+    local = int(now.timestamp()) + 7200
+    sync = coordinator.config_entry.async_create_background_task
+    sync.side_effect = lambda hass, coro, name: coro.close()
+
+    with patch("custom_components.aquarite.coordinator.dt_util") as mock_dt:
+        mock_dt.now.return_value = now
+        for offset in (300, 301, 302, 303):
+            coordinator.async_set_updated_data(
+                {
+                    **mock_pool_data,
+                    "main": {**mock_pool_data["main"], "localTime": local + offset},
+                }
+            )
+
+    assert coordinator.clock_drift == 301
+    sync.assert_called_once()
+
+
+async def test_manual_sync_restarts_drift_estimate(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test a manual clock sync drops the drift measured before it."""
+    tz = timezone(timedelta(hours=2))
+    now = datetime(2026, 4, 12, 14, 30, 0, tzinfo=tz)
+    local = int(now.timestamp()) + 7200
+    sync = coordinator.config_entry.async_create_background_task
+    sync.side_effect = lambda hass, coro, name: coro.close()
+
+    with patch("custom_components.aquarite.coordinator.dt_util") as mock_dt:
+        mock_dt.now.return_value = now
+        for offset in (300, 301):
+            coordinator.async_set_updated_data(
+                {
+                    **mock_pool_data,
+                    "main": {**mock_pool_data["main"], "localTime": local + offset},
+                }
+            )
+        assert coordinator.clock_drift == 300
+        await coordinator.set_pool_time_to_now()
+        assert coordinator.clock_drift is None
+
+        # A stale sample after the sync does not trigger an automatic one.
+        coordinator.async_set_updated_data(
+            {
+                **mock_pool_data,
+                "main": {**mock_pool_data["main"], "localTime": local + 302},
+            }
+        )
+
+    assert coordinator.clock_drift == 302
+    sync.assert_not_called()
+
+
+def test_get_value_uses_compiled_paths(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test get_value resolves nested paths and falls back to the default."""
+    assert coordinator.get_value("modules.rx.current") == 707
+    assert coordinator.get_value("modules.rx.missing", "fallback") == "fallback"
+    assert coordinator.paths.compile("modules.rx.current") == (
+        "modules",
+        "rx",
+        "current",
+    )
+
+
+def test_get_value_memo_invalidated_on_new_snapshot(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test memoized values are dropped when the snapshot is replaced."""
+    assert coordinator.get_value("main.temperature") == 25.5
+    generation = coordinator.paths.generation
+
+    new_data = {**mock_pool_data, "main": {**mock_pool_data["main"], "temperature": 27.0}}
+    coordinator.data = new_data
+
+    assert coordinator.get_value("main.temperature") == 27.0
+    assert coordinator.paths.generation == generation + 1
+
+
+async def test_updates_only_notify_affected_listeners(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test a snapshot only wakes listeners whose value paths changed."""
+    temperature = MagicMock()
+    rx_current = MagicMock()
+    relays = MagicMock()
+    everything = MagicMock()
+    coordinator.async_add_listener(temperature, frozenset({"main.temperature"}))
+    coordinator.async_add_listener(rx_current, frozenset({"modules.rx.current"}))
+    coordinator.async_add_listener(relays, frozenset({"relays"}))
+    coordinator.async_add_listener(everything)
+
+    new_data = {
+        **mock_pool_data,
+        "main": {**mock_pool_data["main"], "temperature": 26.0},
+        "relays": {
+            **mock_pool_data["relays"],
+            "relay2": {"info": {"onoff": 1, "status": 0}},
+        },
+    }
+    coordinator.async_set_updated_data(new_data)
+
+    temperature.assert_called_once()
+    rx_current.assert_not_called()
+    relays.assert_called_once()
+    everything.assert_called_once()
+
+
+async def test_snapshot_burst_is_coalesced(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test a burst of snapshots results in a single dispatch of the newest."""
+    coordinator.config_entry.options = {CONF_COALESCE_WINDOW: 0}
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+
+    first = {**mock_pool_data, "main": {**mock_pool_data["main"], "temperature": 26.0}}
+    second = {**mock_pool_data, "main": {**mock_pool_data["main"], "temperature": 26.5}}
+    coordinator._on_data(first)
+    coordinator._on_data(second)
+    await asyncio.sleep(0)
+
+    listener.assert_called_once()
+    assert coordinator.get_value("main.temperature") == 26.5
+
+
+async def test_urgent_snapshot_bypasses_window(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test a snapshot changing an alarm path is dispatched immediately."""
+    coordinator.config_entry.options = {CONF_COALESCE_WINDOW: 5000}
+    quiet = {**mock_pool_data, "main": {**mock_pool_data["main"], "temperature": 26.0}}
+    alarm = {**quiet, "hidro": {**mock_pool_data["hidro"], "fl1": 1}}
+
+    coordinator._on_data(quiet)
+    await asyncio.sleep(0)
+    assert coordinator.data is mock_pool_data
+
+    coordinator._on_data(alarm)
+    await asyncio.sleep(0)
+    assert coordinator.get_value("hidro.fl1") == 1
+
+
+async def test_duplicate_snapshot_is_dropped(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test a re-delivered identical document never reaches the loop."""
+    coordinator.config_entry.options = {CONF_COALESCE_WINDOW: 0}
+    snapshot = {**mock_pool_data, "main": {**mock_pool_data["main"], "temperature": 26.0}}
+
+    coordinator._on_data(snapshot)
+    await asyncio.sleep(0)
+    coordinator._on_data({**snapshot})
+    await asyncio.sleep(0)
+
+    assert coordinator.get_value("main.temperature") == 26.0
+    assert coordinator.snapshots_received == 2
+    assert coordinator.snapshots_duplicate == 1
+
+
+async def test_staleness_follows_snapshot_cadence(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test a pool is stale after a few missed snapshots of its own cadence."""
+    assert not coordinator.is_stale(1000.0, None)
+    assert coordinator.stale_after() == 300
+
+    for now in (1000.0, 1020.0, 1040.0, 1060.0):
+        coordinator._record_arrival(now)
+    assert coordinator.stale_after() == 60
+    assert not coordinator.is_stale(1100.0, 990.0)
+    assert coordinator.is_stale(1130.0, 990.0)
+    # A freshly started watch gets a full window of its own
+    assert not coordinator.is_stale(1130.0, 1120.0)
+
+
+async def test_snapshot_latency_is_recorded_per_stage(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test cloud, handoff and fan-out latency are sampled per delivery."""
+    coordinator.config_entry.options = {CONF_COALESCE_WINDOW: 0}
+
+    def snapshot(light: int) -> dict:
+        return {**mock_pool_data, "light": {"status": light}}
+
+    coordinator._on_data(snapshot(0))
+    await asyncio.sleep(0)
+    # Only a snapshot echoing an accepted write is a cloud round trip
+    assert coordinator.latency["cloud"].count == 0
+
+    await coordinator.async_set_value("light.status", 1)
+    coordinator._on_data(snapshot(1))
+    await asyncio.sleep(0)
+    coordinator._on_data({**snapshot(1), "present": False})
+    await asyncio.sleep(0)
+
+    cloud = coordinator.latency["cloud"]
+    assert cloud.count == 1
+    assert cloud.maximum < 1
+    assert coordinator.latency["handoff"].count == 3
+    assert coordinator.latency["fanout"].count == 3
+
+
+async def test_snapshot_is_preprocessed_off_loop(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test snapshots arrive on the loop coerced and with their diff."""
+    coordinator.config_entry.options = {CONF_COALESCE_WINDOW: 0}
+    snapshot = {**mock_pool_data, "main": {**mock_pool_data["main"], "temperature": 26.0}}
+
+    coordinator._on_data(snapshot)
+    await asyncio.sleep(0)
+
+    assert coordinator.get_value("modules.ph.current") == 742
+    assert coordinator.last_diff.changed == {
+        "main.temperature",
+        "modules.ph.current",
+        "modules.ph.status.low_value",
+        "modules.ph.status.high_value",
+        "filtration.intel.time",
+    }
+
+
+async def test_load_cache(
+    hass_storage,
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test the persisted snapshot is only used for the same pool."""
+    hass_storage["aquarite.test"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "aquarite.test",
+        "data": {"pool_id": MOCK_POOL_ID, "data": mock_pool_data},
+    }
+    assert await coordinator.async_load_cache() == mock_pool_data
+
+    hass_storage["aquarite.test"]["data"]["pool_id"] = "other"
+    assert await coordinator.async_load_cache() is None
+
+
+async def test_stored_snapshot_is_redacted(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test address and location never reach the store."""
+    stored = coordinator._data_to_store()["data"]
+
+    assert stored["form"] == {"country": "BE"}
+    assert stored["main"] == coordinator.data["main"]
+
+
+async def test_cached_data_is_assumed_until_live(
+    hass_storage,
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test entities know they run from the cache until live data arrives."""
+    hass_storage["aquarite.test"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "aquarite.test",
+        "data": {
+            "pool_id": MOCK_POOL_ID,
+            "saved_at": "2026-04-12T12:00:00+00:00",
+            "data": mock_pool_data,
+        },
+    }
+    coordinator.data = await coordinator.async_load_cache()
+    assert coordinator.from_cache
+    assert coordinator.cache_saved_at.isoformat() == "2026-04-12T12:00:00+00:00"
+
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, frozenset({"light.status"}))
+    coordinator.async_set_updated_data(mock_pool_data)
+
+    # Nothing changed, but every entity leaves its assumed state
+    listener.assert_called_once()
+    assert not coordinator.from_cache
+
+
+async def test_connect_in_background_starts_reauth(
+    coordinator: AquariteDataUpdateCoordinator,
+) -> None:
+    """Test invalid credentials during a background connect start reauth."""
+    coordinator.account.async_authenticate.side_effect = AuthenticationError
+    await coordinator.async_connect_in_background()
+
+    coordinator.config_entry.async_start_reauth.assert_called_once()
+    coordinator.account.watches.async_attach.assert_not_called()
+    assert coordinator.connection_state == "auth_failed"
+
+
+async def test_connection_state_transitions_are_counted(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test connect, a failed resubscribe and recovery move the state machine."""
+    coordinator.api.fetch_pool_data = AsyncMock(return_value=mock_pool_data)
+    await coordinator.async_connect()
+    assert coordinator.connection_state == "live"
+
+    coordinator.account.watches.async_resubscribe.side_effect = OSError("offline")
+    with pytest.raises(OSError):
+        await coordinator.refresh_subscription()
+    assert coordinator.connection_state == "backoff"
+
+    # A stale stream recovers as soon as a snapshot arrives
+    coordinator.async_set_connection_state("stale")
+    coordinator._on_data(mock_pool_data)
+    await asyncio.sleep(0)
+
+    assert coordinator.connection_state == "live"
+    assert coordinator.connection_transitions == {
+        "connecting": 1,
+        "live": 2,
+        "stale": 1,
+        "resubscribing": 1,
+        "backoff": 1,
+        "auth_failed": 0,
+    }
+    assert coordinator.connection_entered["backoff"] <= coordinator.connection_since
+
+
+async def test_resubscribed_pool_is_live_only_after_snapshot(
+    coordinator: AquariteDataUpdateCoordinator,
+    mock_pool_data,
+) -> None:
+    """Test a rebuilt watch does not count as live before it delivers."""
+    coordinator.async_set_connection_state("live")
+    await coordinator.refresh_subscription()
+    assert coordinator.connection_state == "resubscribing"
+
+    coordinator.async_set_connection_state("stale")
+    await coordinator.refresh_subscription()
+    assert coordinator.connection_state == "stale"
+
+    coordinator._on_data(mock_pool_data)
+    await asyncio.sleep(0)
+    assert coordinator.connection_state == "live"
@@ -0,0 +1,51 @@
+"""Tests for the Aquarite latency histograms.
+
+These tests require the Home Assistant test framework (pytest-homeassistant-custom-component).
+Run with: pytest tests/test_latency.py (requires HA test environment)
+"""
+from __future__ import annotations
+
+import pytest
+
+# Skip the entire module if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.aquarite.latency import AquariteLatencyHistogram  # noqa: E402
+
+
+def test_empty_histogram() -> None:
+    """Test a histogram without samples reports nothing."""
+    histogram = AquariteLatencyHistogram()
+    assert histogram.quantile(0.5) is None
+    summary = histogram.as_dict()
+    assert summary["count"] == 0
+    assert summary["mean"] is None
+    assert summary["p99"] is None
+
+
+def test_quantiles_use_bucket_bounds() -> None:
+    """Test quantiles resolve to bucket bounds, capped by the largest sample."""
+    histogram = AquariteLatencyHistogram((0.01, 0.1, 1))
+    for sample in (0.004, 0.005, 0.05, 0.08, 0.3, -0.2):
+        histogram.record(sample)
+
+    assert histogram.quantile(0.5) == 0.01
+    assert histogram.quantile(0.8) == 0.1
+    assert histogram.quantile(1) == 0.3
+    assert histogram.as_dict()["buckets"] == {
+        "le_0.01": 3,
+        "le_0.1": 2,
+        "le_1": 1,
+        "inf": 0,
+    }
+
+
+def test_overflow_bucket_reports_maximum() -> None:
+    """Test samples beyond the last bound keep a fixed size and report the max."""
+    histogram = AquariteLatencyHistogram((0.01, 0.1))
+    for _ in range(1000):
+        histogram.record(42.0)
+
+    assert histogram.quantile(0.5) == 42.0
+    assert histogram.as_dict()["buckets"]["inf"] == 1000
+    assert len(histogram.as_dict()["buckets"]) == 3
@@ -0,0 +1,63 @@
+"""Tests for the shared Aquarite scheduler.
+
+These tests require the Home Assistant test framework (pytest-homeassistant-custom-component).
+Run with: pytest tests/test_scheduler.py (requires HA test environment)
+"""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+# Skip the entire module if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.aquarite.scheduler import async_get_scheduler  # noqa: E402
+
+
+async def test_jobs_run_in_deadline_order_and_repeat(hass) -> None:
+    """Test jobs run earliest first and are requeued with their returned delay."""
+    scheduler = async_get_scheduler(hass)
+    assert async_get_scheduler(hass) is scheduler
+    runs: list[str] = []
+
+    def job(name: str, delays: list[float | None]):
+        async def run() -> float | None:
+            runs.append(name)
+            return delays.pop(0)
+
+        return run
+
+    scheduler.async_schedule("slow", job("slow", [None]), 0.1)
+    scheduler.async_schedule("fast", job("fast", [0.02, None]), 0.02)
+    await asyncio.sleep(0.2)
+
+    assert runs == ["fast", "fast", "slow"]
+    assert len(scheduler) == 0
+
+
+async def test_cancelled_job_never_runs(hass) -> None:
+    """Test a cancelled job is dropped without firing."""
+    scheduler = async_get_scheduler(hass)
+    job = AsyncMock(return_value=0.01)
+
+    cancel = scheduler.async_schedule("job", job, 0.02)
+    assert len(scheduler) == 1
+    cancel()
+    await asyncio.sleep(0.05)
+
+    job.assert_not_called()
+    assert len(scheduler) == 0
+
+
+async def test_failing_job_runs_again(hass) -> None:
+    """Test a job that raises is rescheduled instead of dropped."""
+    scheduler = async_get_scheduler(hass)
+    job = AsyncMock(side_effect=[RuntimeError("boom"), None])
+
+    scheduler.async_schedule("job", job, 0.02)
+    await asyncio.sleep(0.1)
+
+    assert job.await_count == 2
+    assert len(scheduler) == 0
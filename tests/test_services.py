@@ -0,0 +1,158 @@
+"""Tests for the Aquarite services."""
+from __future__ import annotations
+
+import asyncio
+import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Skip the entire module if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from homeassistant.exceptions import ServiceValidationError  # noqa: E402
+
+from custom_components.aquarite.services import (  # noqa: E402
+    async_sync_pool_times,
+    build_filtration_schedule,
+)
+from custom_components.aquarite.settings import convert_settings  # noqa: E402
+
+
+@pytest.fixture
+def coordinator(mock_pool_data) -> MagicMock:
+    """Return a coordinator stub reading the mock pool data."""
+
+    def get_value(path: str, default=None):
+        value = mock_pool_data
+        for key in path.split("."):
+            if not isinstance(value, dict) or key not in value:
+                return default
+            value = value[key]
+        return value
+
+    coordinator = MagicMock()
+    coordinator.get_value = MagicMock(side_effect=get_value)
+    coordinator.get_display_value = MagicMock(side_effect=get_value)
+    return coordinator
+
+
+def test_schedule_merges_with_current_values(coordinator: MagicMock) -> None:
+    """Test omitted fields keep the pool's current schedule."""
+    values = build_filtration_schedule(
+        coordinator,
+        {
+            "interval2_start": datetime.time(12, 0),
+            "interval2_end": datetime.time(14, 0),
+            "interval2_speed": "high",
+        },
+    )
+
+    assert values == {
+        "filtration.interval1.from": 28800,
+        "filtration.interval1.to": 36000,
+        "filtration.interval2.from": 43200,
+        "filtration.interval2.to": 50400,
+        "filtration.timerVel2": 2,
+        "filtration.interval3.from": 68400,
+        "filtration.interval3.to": 70200,
+    }
+
+
+def test_schedule_rejects_reversed_interval(coordinator: MagicMock) -> None:
+    """Test an interval ending before it starts is rejected."""
+    with pytest.raises(ServiceValidationError, match="interval 1 ends"):
+        build_filtration_schedule(
+            coordinator,
+            {
+                "interval1_start": datetime.time(10, 0),
+                "interval1_end": datetime.time(9, 0),
+            },
+        )
+
+
+def test_schedule_rejects_overlap(coordinator: MagicMock) -> None:
+    """Test overlapping enabled intervals are rejected."""
+    with pytest.raises(ServiceValidationError, match="1 and 2 overlap"):
+        build_filtration_schedule(
+            coordinator,
+            {"interval2_start": datetime.time(9, 0)},
+        )
+
+
+def test_disabled_interval_may_overlap(coordinator: MagicMock) -> None:
+    """Test an interval with equal start and end is not checked for overlap."""
+    values = build_filtration_schedule(
+        coordinator,
+        {
+            "interval2_start": datetime.time(9, 0),
+            "interval2_end": datetime.time(9, 0),
+        },
+    )
+
+    assert values["filtration.interval2.from"] == values["filtration.interval2.to"]
+
+
+def test_settings_are_scaled_and_indexed(coordinator: MagicMock) -> None:
+    """Test settings convert with the entity scale tables and options."""
+    values = convert_settings(
+        coordinator,
+        {
+            "modules.ph.status.low_value": 7.2,
+            "hidro.level": 12.5,
+            "filtration.mode": "auto",
+            "relays.relay1.info.onoff": True,
+        },
+    )
+
+    assert values == {
+        "modules.ph.status.low_value": 720,
+        "hidro.level": 125,
+        "filtration.mode": 1,
+        "relays.relay1.info.onoff": 1,
+    }
+
+
+@pytest.mark.parametrize(
+    ("settings", "message"),
+    [
+        ({"main.version": 1}, "not a writable setting"),
+        ({"modules.rx.status.value": 900}, "between 500 and 800"),
+        ({"hidro.level": 30}, "between 0 and 22"),
+        ({"filtration.mode": "turbo"}, "must be one of"),
+        ({"filtration.heating.temp": 28}, "not supported"),
+    ],
+)
+def test_invalid_settings_are_rejected(
+    coordinator: MagicMock, settings: dict, message: str
+) -> None:
+    """Test unknown, out-of-range and unsupported settings are rejected."""
+    with pytest.raises(ServiceValidationError, match=message):
+        convert_settings(coordinator, settings)
+
+
+async def test_sync_pool_times_runs_concurrently(hass) -> None:
+    """Test pools sync in parallel and a stuck pool only fails itself."""
+
+    def pool(entry_id: str, sync: AsyncMock) -> MagicMock:
+        coordinator = MagicMock()
+        coordinator.config_entry.entry_id = entry_id
+        coordinator.config_entry.title = entry_id.title()
+        coordinator.set_pool_time_to_now = sync
+        return coordinator
+
+    async def stuck() -> None:
+        await asyncio.sleep(10)
+
+    pools = [
+        pool("fast", AsyncMock()),
+        pool("stuck", AsyncMock(side_effect=stuck)),
+        pool("broken", AsyncMock(side_effect=RuntimeError("rejected"))),
+    ]
+    with patch("custom_components.aquarite.services.SYNC_TIME_TIMEOUT", 0.05):
+        results = await async_sync_pool_times(pools)
+
+    assert results["fast"]["success"] is True
+    assert results["stuck"]["error"] == "timed out after 0.05s"
+    assert results["broken"]["error"] == "rejected"
+    assert all(result["latency_ms"] < 1000 for result in results.values())
@@ -0,0 +1,93 @@
+"""Tests for Aquarite snapshot diffing.
+
+These tests require the Home Assistant test framework (pytest-homeassistant-custom-component).
+Run with: pytest tests/test_snapshot.py (requires HA test environment)
+"""
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+import pytest
+
+# Skip the entire module if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.aquarite.snapshot import (  # noqa: E402
+    SnapshotDiff,
+    diff_snapshots,
+    fingerprint,
+    normalize,
+)
+
+
+def test_diff_identical_documents(mock_pool_data: dict[str, Any]) -> None:
+    """Test identical documents produce an empty diff."""
+    diff = diff_snapshots(mock_pool_data, copy.deepcopy(mock_pool_data))
+    assert diff == SnapshotDiff()
+    assert not diff
+
+
+def test_diff_changed_leaves(mock_pool_data: dict[str, Any]) -> None:
+    """Test changed leaves are reported by their full dotted path."""
+    new = copy.deepcopy(mock_pool_data)
+    new["main"]["temperature"] = 26.0
+    new["modules"]["rx"]["current"] = 710
+
+    diff = diff_snapshots(mock_pool_data, new)
+
+    assert diff.changed == {"main.temperature", "modules.rx.current"}
+    assert not diff.added
+    assert not diff.removed
+
+
+def test_diff_added_and_removed_subtrees(mock_pool_data: dict[str, Any]) -> None:
+    """Test added and removed keys are reported as subtree roots."""
+    new = copy.deepcopy(mock_pool_data)
+    del new["backwash"]
+    new["modules"]["cl"] = {"current": 120, "tank": 0}
+
+    diff = diff_snapshots(mock_pool_data, new)
+
+    assert diff.added == {"modules.cl"}
+    assert diff.removed == {"backwash"}
+    assert diff.paths == {"modules.cl", "backwash"}
+
+
+def test_diff_without_previous_document(mock_pool_data: dict[str, Any]) -> None:
+    """Test the first snapshot reports every top-level key as added."""
+    diff = diff_snapshots(None, mock_pool_data)
+    assert diff.added == set(mock_pool_data)
+
+
+def test_fingerprint_ignores_key_order(mock_pool_data: dict[str, Any]) -> None:
+    """Test equal content fingerprints alike regardless of key order."""
+    reordered = dict(reversed(list(copy.deepcopy(mock_pool_data).items())))
+    assert fingerprint(reordered) == fingerprint(mock_pool_data)
+
+    changed = copy.deepcopy(mock_pool_data)
+    changed["main"]["temperature"] = 26.0
+    assert fingerprint(changed) != fingerprint(mock_pool_data)
+
+
+def test_normalize_coerces_numeric_strings(mock_pool_data: dict[str, Any]) -> None:
+    """Test numeric strings become numbers only in known numeric fields."""
+    data = copy.deepcopy(mock_pool_data)
+    data["form"]["zipcode"] = "01410"
+    data["modules"]["ph"]["status"]["low_value"] = "07"
+    data["main"]["version"] = "1234"
+    data["main"]["hasUV"] = "0"
+    data["main"]["hasLED"] = "0"
+
+    normalized = normalize(data)
+
+    assert normalized["modules"]["ph"]["current"] == 742
+    assert normalized["filtration"]["intel"]["time"] == 600
+    assert normalized["modules"]["ph"]["status"]["low_value"] == "07"
+    assert normalized["form"]["lat"] == "50.7"
+    assert normalized["form"]["zipcode"] == "01410"
+    assert normalized["main"]["version"] == "1234"
+    # Capability flags gate entities, so "0" must not read as enabled.
+    assert normalized["main"]["hasUV"] == 0
+    assert normalized["main"]["hasLED"] == 0
+    assert data["modules"]["ph"]["current"] == "742"